@@ -1,21 +1,868 @@
 import platform
-import wmi
+import os
 import psutil
 import cpuinfo
 import json
 import csv
+import queue
+import sys
 import threading
 import time
 import customtkinter as ctk
+from contextlib import contextmanager
 from datetime import datetime
 
-# Initialize WMI interface for Windows hardware queries
-c = wmi.WMI()
+try:
+    import wmi
+    import pythoncom
+except ImportError:  # Not Windows, or wmi/pywin32 not installed
+    wmi = None
+    pythoncom = None
+
+# Per-user directory for indexes and history kept between runs
+DATA_DIR = os.path.join(os.path.expanduser("~"), ".hardwarehouse")
 
 # Set up customtkinter appearance and theme
 ctk.set_appearance_mode("System")  # "Dark", "Light", or "System"
 ctk.set_default_color_theme("blue")  # Themes: "blue", "dark-blue", "green"
 
+# --------------------------
+# WMI Connection
+# --------------------------
+
+class WMIConnectionProvider:
+    """Hand out one lazily created WMI connection per thread.
+
+    COM is initialized on a thread the first time it asks for a connection,
+    and uninitialized again when release() is called on that thread. A
+    factory (e.g. a FakeWMIConnection) can stand in for wmi.WMI().
+    """
+
+    def __init__(self, factory=None):
+        self._local = threading.local()
+        self._factory = factory
+        self._generation = 0
+
+    def set_factory(self, factory):
+        """Build connections with factory() from now on; None restores wmi.WMI()"""
+        self._factory = factory
+        self._generation += 1
+        clear_wql_cache()
+
+    def get(self):
+        """Return this thread's WMI connection, connecting on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.generation != self._generation:
+            self.release()
+            conn = None
+        if conn is None:
+            if self._factory is not None:
+                conn = self._factory()
+                self._local.com = False
+            else:
+                if wmi is None:
+                    raise RuntimeError("WMI is not available on this system")
+                pythoncom.CoInitialize()
+                try:
+                    conn = wmi.WMI()
+                except Exception:
+                    pythoncom.CoUninitialize()
+                    raise
+                self._local.com = True
+            self._local.conn = conn
+            self._local.generation = self._generation
+        return conn
+
+    def release(self):
+        """Drop this thread's connection and uninitialize COM if it was used"""
+        if getattr(self._local, "conn", None) is not None:
+            self._local.conn = None
+            if self._local.com:
+                pythoncom.CoUninitialize()
+
+    @contextmanager
+    def thread_scope(self):
+        """Release the thread's connection when the outermost scope exits"""
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        try:
+            yield
+        finally:
+            self._local.depth = depth
+            if depth == 0:
+                self.release()
+
+wmi_provider = WMIConnectionProvider()
+
+def get_wmi():
+    """Return the calling thread's WMI connection"""
+    return wmi_provider.get()
+
+# --------------------------
+# WMI Queries
+# --------------------------
+
+# Materialized query results keyed by WQL text
+_wql_cache = {}
+_wql_cache_lock = threading.Lock()
+
+def build_wql(wmi_class, properties, where=None):
+    """Return a projected WQL SELECT for the given class and properties"""
+    wql = f"SELECT {', '.join(properties)} FROM {wmi_class}"
+    if where:
+        wql += f" WHERE {where}"
+    return wql
+
+def _materialize(obj, properties):
+    """Copy the projected properties of one WMI object into a plain dict"""
+    ole_object = getattr(obj, "ole_object", None)
+    if ole_object is not None:
+        # Look up the selected names only: a projected instance still lists
+        # every class property in Properties_ (unselected ones NULL), so
+        # enumerating it would cost a round trip per class property. Going
+        # through ole_object also skips the wmi wrapper's per-attribute
+        # method lookup; references come back as raw object paths.
+        return {name: ole_object.Properties_(name).Value for name in properties}
+    return {name: getattr(obj, name, None) for name in properties}
+
+def wmi_query(wmi_class, properties, where=None, cache=True):
+    """Run a projected WQL query and return its rows as plain dicts.
+
+    Results are cached by WQL text until clear_wql_cache() is called; pass
+    cache=False for values that change while the system is running.
+    """
+    wql = build_wql(wmi_class, properties, where)
+    if cache:
+        with _wql_cache_lock:
+            rows = _wql_cache.get(wql)
+        if rows is not None:
+            return rows
+    rows = [_materialize(obj, properties) for obj in get_wmi().query(wql)]
+    if cache:
+        with _wql_cache_lock:
+            _wql_cache[wql] = rows
+    return rows
+
+def wmi_ref_key(ref):
+    """Return the key value of a WMI object path such as an association's Dependent"""
+    # \\HOST\root\cimv2:Win32_PnPEntity.DeviceID="USB\\VID_046D&PID_C52B\\5&1A2B"
+    _, _, key = (ref or "").partition("=")
+    return key.strip().strip('"').replace("\\\\", "\\")
+
+def clear_wql_cache():
+    """Forget every cached WQL result"""
+    with _wql_cache_lock:
+        _wql_cache.clear()
+
+class FakeWMIObject:
+    """A WMI instance backed by a dict, charging latency like a COM object.
+
+    Like a real projected instance it carries every class property, with the
+    unselected ones set to None.
+    """
+
+    def __init__(self, connection, properties):
+        self._connection = connection
+        self._properties = properties
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        # Every attribute read is a round trip on a real COM object
+        self._connection._charge(self._connection.property_latency)
+        try:
+            return self._properties[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    @property
+    def ole_object(self):
+        return self
+
+    @property
+    def Properties_(self):
+        return FakeWMIProperties(self._connection, self._properties)
+
+class FakeWMIProperties:
+    """A FakeWMIObject's Properties_ collection; every item fetched is a round trip"""
+
+    def __init__(self, connection, properties):
+        self._connection = connection
+        self._properties = properties
+
+    def __call__(self, name):
+        self._connection._charge(self._connection.property_latency)
+        if name not in self._properties:
+            raise KeyError(name)
+        return FakeWMIProperty(name, self._properties[name])
+
+    def __iter__(self):
+        for name, value in self._properties.items():
+            self._connection._charge(self._connection.property_latency)
+            yield FakeWMIProperty(name, value)
+
+class FakeWMIProperty:
+    """One entry of a FakeWMIObject's Properties_ collection"""
+
+    def __init__(self, name, value):
+        self.Name = name
+        self.Value = value
+
+class FakeWMIConnection:
+    """In-process stand-in for wmi.WMI() with injectable latency.
+
+    instances maps class names to lists of property dicts. query_latency is
+    charged per query, and property_latency per property transferred, per
+    attribute read and per Properties_ item fetched, so projected and
+    unprojected queries can be compared on machines without WMI. Install it
+    with wmi_provider.set_factory().
+    """
+
+    def __init__(self, instances, query_latency=0.0, property_latency=0.0):
+        self.instances = instances
+        self.query_latency = query_latency
+        self.property_latency = property_latency
+        self.queries = []
+
+    def _charge(self, seconds):
+        if seconds:
+            time.sleep(seconds)
+
+    def _select(self, wmi_class, properties, where=None):
+        if properties is not None:
+            # Real WMI rejects a projection naming a property the class lacks
+            known = set().union(*self.instances.get(wmi_class, []))
+            unknown = [p for p in properties if known and p not in known]
+            if unknown:
+                raise ValueError(f"Invalid query: {wmi_class} has no {', '.join(unknown)}")
+        rows = []
+        for instance in self.instances.get(wmi_class, []):
+            if where and not where(instance):
+                continue
+            if properties is None:
+                row = instance
+                transferred = len(instance)
+            else:
+                row = {p: instance.get(p) if p in properties else None for p in instance}
+                transferred = len(properties)
+            self._charge(self.property_latency * transferred)
+            rows.append(FakeWMIObject(self, row))
+        return rows
+
+    def query(self, wql):
+        """Run a 'SELECT props FROM class [WHERE prop = / LIKE 'value']' query"""
+        import re
+        self.queries.append(wql)
+        self._charge(self.query_latency)
+        match = re.match(r"\s*SELECT\s+(.+?)\s+FROM\s+(\w+)(?:\s+WHERE\s+(.+))?\s*$", wql, re.I)
+        if not match:
+            raise ValueError(f"Unsupported WQL: {wql}")
+        fields, wmi_class, where = match.groups()
+        properties = None if fields.strip() == "*" else [f.strip() for f in fields.split(",")]
+        condition = None
+        if where:
+            cond = re.match(r"(\w+)\s+(=|LIKE)\s+'([^']*)'", where.strip(), re.I)
+            if not cond:
+                raise ValueError(f"Unsupported WHERE clause: {where}")
+            prop, op, value = cond.groups()
+            if op.upper() == "LIKE":
+                pattern = re.compile("^" + ".*".join(map(re.escape, value.split("%"))) + "$", re.I)
+                condition = lambda inst: pattern.match(str(inst.get(prop, ""))) is not None
+            else:
+                condition = lambda inst: str(inst.get(prop, "")).lower() == value.lower()
+        return self._select(wmi_class, properties, condition)
+
+    def __getattr__(self, name):
+        # c.Win32_Processor() style access fetches every property
+        if name.startswith("Win32_"):
+            def fetch_all():
+                self.queries.append(f"SELECT * FROM {name}")
+                self._charge(self.query_latency)
+                return self._select(name, None)
+            return fetch_all
+        raise AttributeError(name)
+
+def _fake_wmi_path(wmi_class, device_id):
+    """Object path of a device as association classes (Win32_USBControllerDevice) report it"""
+    return '\\\\HOST\\root\\cimv2:' + wmi_class + '.DeviceID="' + device_id.replace("\\", "\\\\") + '"'
+
+# Small recorded inventory for FakeWMIConnection; the extra properties make
+# unprojected queries pay for data the collectors never read
+FAKE_WMI_INSTANCES = {
+    "Win32_Processor": [{
+        "Name": "Intel(R) Core(TM) i7-9700K CPU @ 3.60GHz", "Manufacturer": "GenuineIntel",
+        "NumberOfCores": 8, "NumberOfLogicalProcessors": 8, "MaxClockSpeed": 3600,
+        "CurrentClockSpeed": 3600, "Architecture": 9, "ProcessorId": "BFEBFBFF000906EC",
+        "L2CacheSize": 2048, "L3CacheSize": 12288, "Caption": "Intel64 Family 6 Model 158 Stepping 12",
+        "DeviceID": "CPU0", "Family": 198, "LoadPercentage": 3, "SocketDesignation": "LGA1151",
+        "Status": "OK", "Stepping": "12", "UpgradeMethod": 1, "Version": "", "VoltageCaps": None,
+        "AddressWidth": 64, "DataWidth": 64, "ExtClock": 100, "Level": 6, "Revision": 40460,
+    }],
+    "Win32_VideoController": [{
+        "Name": "NVIDIA GeForce RTX 2070", "DriverVersion": "31.0.15.3623",
+        "VideoProcessor": "NVIDIA GeForce RTX 2070", "AdapterRAM": 4293918720,
+        "VideoModeDescription": "2560 x 1440 x 4294967296 colors", "Status": "OK",
+        "AdapterCompatibility": "NVIDIA", "AdapterDACType": "Integrated RAMDAC",
+        "CurrentBitsPerPixel": 32, "CurrentHorizontalResolution": 2560,
+        "CurrentVerticalResolution": 1440, "CurrentRefreshRate": 144, "DeviceID": "VideoController1",
+        "DriverDate": "20230810000000.000000-000", "InfSection": "Section063",
+        "PNPDeviceID": "PCI\\VEN_10DE&DEV_1F02&SUBSYS_37333842&REV_A1\\4&2A3B1F0&0&0008",
+        "VideoArchitecture": 5, "VideoMemoryType": 2,
+    }],
+    "Win32_BIOS": [{
+        "Manufacturer": "American Megatrends Inc.", "SMBIOSBIOSVersion": "F12",
+        "ReleaseDate": "20200527000000.000000+000", "SerialNumber": "Default string",
+        "CurrentLanguage": "en|US|iso8859-1", "BIOSVersion": ["ALASKA - 1072009", "F12"],
+        "Caption": "F12", "PrimaryBIOS": True, "SMBIOSMajorVersion": 3, "SMBIOSMinorVersion": 2,
+        "Status": "OK", "Version": "ALASKA - 1072009",
+    }],
+    "Win32_BaseBoard": [{
+        "Manufacturer": "Gigabyte Technology Co., Ltd.", "Product": "Z390 AORUS PRO",
+        "SerialNumber": "Default string", "Version": "x.x", "Model": None,
+        "Caption": "Base Board", "HostingBoard": True, "Replaceable": True, "Status": "OK",
+        "Tag": "Base Board",
+    }],
+    "Win32_SoundDevice": [
+        {"Name": "Realtek High Definition Audio", "Status": "OK", "Manufacturer": "Realtek",
+         "DeviceID": "HDAUDIO\\FUNC_01&VEN_10EC&DEV_1220", "ProductName": "Realtek High Definition Audio"},
+        {"Name": "NVIDIA High Definition Audio", "Status": "OK", "Manufacturer": "NVIDIA",
+         "DeviceID": "HDAUDIO\\FUNC_01&VEN_10DE&DEV_0010", "ProductName": "NVIDIA High Definition Audio"},
+    ],
+    "Win32_USBController": [
+        {"DeviceID": "PCI\\VEN_8086&DEV_A36D&SUBSYS_50071458&REV_10\\3&11583659&0&A0",
+         "Name": "Intel(R) USB 3.1 eXtensible Host Controller - 1.10 (Microsoft)",
+         "Status": "OK", "Manufacturer": "Generic USB xHCI Host Controller"},
+    ],
+    "Win32_PnPEntity": [
+        {"DeviceID": "PCI\\VEN_8086&DEV_A36D&SUBSYS_50071458&REV_10\\3&11583659&0&A0",
+         "Name": "Intel(R) USB 3.1 eXtensible Host Controller - 1.10 (Microsoft)",
+         "Manufacturer": "Generic USB xHCI Host Controller", "Service": "USBXHCI", "Status": "OK",
+         "PNPClass": "USB"},
+        {"DeviceID": "USB\\ROOT_HUB30\\4&2D5B4F5&0&0", "Name": "USB Root Hub (USB 3.0)",
+         "Manufacturer": "(Standard USB HUBs)", "Service": "USBHUB3", "Status": "OK", "PNPClass": "USB"},
+        {"DeviceID": "USB\\VID_046D&PID_C52B\\5&1A2B3C4D&0&1", "Name": "USB Composite Device",
+         "Manufacturer": "(Standard USB Host Controller)", "Service": "usbccgp", "Status": "OK",
+         "PNPClass": "USB"},
+        {"DeviceID": "USB\\VID_046D&PID_C52B&MI_00\\6&2E1D4F&0&0000", "Name": "USB Input Device",
+         "Manufacturer": "(Standard system devices)", "Service": "HidUsb", "Status": "OK",
+         "PNPClass": "HIDClass"},
+        {"DeviceID": "HID\\VID_046D&PID_C52B&MI_00\\7&3A1B&0&0000", "Name": "HID Keyboard Device",
+         "Manufacturer": "(Standard keyboards)", "Service": "kbdhid", "Status": "OK",
+         "PNPClass": "Keyboard"},
+    ],
+    "Win32_USBControllerDevice": [
+        {"Antecedent": _fake_wmi_path("Win32_USBController",
+                                      "PCI\\VEN_8086&DEV_A36D&SUBSYS_50071458&REV_10\\3&11583659&0&A0"),
+         "Dependent": _fake_wmi_path("Win32_PnPEntity", device_id)}
+        for device_id in (
+            "USB\\ROOT_HUB30\\4&2D5B4F5&0&0",
+            "USB\\VID_046D&PID_C52B\\5&1A2B3C4D&0&1",
+            "USB\\VID_046D&PID_C52B&MI_00\\6&2E1D4F&0&0000",
+            "HID\\VID_046D&PID_C52B&MI_00\\7&3A1B&0&0000",
+        )
+    ],
+}
+
+# --------------------------
+# Hardware Providers
+# --------------------------
+
+def _usb_node(kind, name, device_id, vid=None, pid=None, speed=None,
+              driver=None, manufacturer=None, status=None):
+    """Return one node of the USB controller -> hub -> device tree"""
+    return {
+        "Type": kind,
+        "Name": name,
+        "Manufacturer": manufacturer,
+        "Device ID": device_id,
+        "VID": vid,
+        "PID": pid,
+        "Speed (Mbps)": speed or "Unknown",
+        "Driver": driver,
+        "Status": status or "OK",
+        "Children": [],
+    }
+
+def _usb_ids(device_id):
+    """Return (VID, PID) parsed from a PnP device ID such as USB\\VID_046D&PID_C52B\\..."""
+    import re
+    match = re.search(r"VID_([0-9A-F]{4})&PID_([0-9A-F]{4})", device_id or "", re.I)
+    return (match.group(1).upper(), match.group(2).upper()) if match else (None, None)
+
+class WMIHardwareProvider:
+    """Hardware details read through projected WMI queries (Windows)"""
+
+    name = "wmi"
+
+    def cpu_info(self):
+        for cpu in wmi_query("Win32_Processor", [
+            "Name", "Manufacturer", "NumberOfCores", "NumberOfLogicalProcessors",
+            "MaxClockSpeed", "CurrentClockSpeed", "Architecture", "ProcessorId",
+            "L2CacheSize", "L3CacheSize",
+        ]):
+            return {
+                "Name": (cpu["Name"] or "").strip(),
+                "Manufacturer": cpu["Manufacturer"],
+                "Cores (Physical)": cpu["NumberOfCores"],
+                "Threads (Logical)": cpu["NumberOfLogicalProcessors"],
+                "Max Clock Speed (MHz)": cpu["MaxClockSpeed"],
+                "Current Clock Speed (MHz)": cpu["CurrentClockSpeed"],
+                "Architecture": cpu["Architecture"],
+                "Processor ID": cpu["ProcessorId"],
+                "L2 Cache Size (KB)": cpu["L2CacheSize"],
+                "L3 Cache Size (KB)": cpu["L3CacheSize"],
+                # Per socket; WMI doesn't show how a socket's L3 is split between dies
+                "L3 Cache Per Instance (KB)": cpu["L3CacheSize"],
+            }
+        return {}
+
+    def gpu_info(self):
+        gpus = []
+        for gpu in wmi_query("Win32_VideoController", [
+            "Name", "DriverVersion", "VideoProcessor", "AdapterRAM", "VideoModeDescription", "Status",
+        ]):
+            gpus.append({
+                "Name": gpu["Name"],
+                "Driver Version": gpu["DriverVersion"],
+                "Video Processor": gpu["VideoProcessor"],
+                "RAM (MB)": int(gpu["AdapterRAM"]) // (1024*1024) if gpu["AdapterRAM"] else "Unknown",
+                "Video Mode": gpu["VideoModeDescription"],
+                "Status": gpu["Status"]
+            })
+        return gpus
+
+    def bios_info(self):
+        for bios in wmi_query("Win32_BIOS", [
+            "Manufacturer", "SMBIOSBIOSVersion", "ReleaseDate", "SerialNumber", "CurrentLanguage",
+        ]):
+            return {
+                "Manufacturer": bios["Manufacturer"],
+                "Version": bios["SMBIOSBIOSVersion"],
+                "Release Date": bios["ReleaseDate"],
+                "Serial Number": bios["SerialNumber"],
+                "BIOS Language": bios["CurrentLanguage"] or "N/A"
+            }
+        return {}
+
+    def motherboard_info(self):
+        for board in wmi_query("Win32_BaseBoard", [
+            "Manufacturer", "Product", "SerialNumber", "Version", "Model",
+        ]):
+            return {
+                "Manufacturer": board["Manufacturer"],
+                "Product": board["Product"],
+                "Serial Number": board["SerialNumber"],
+                "Version": board["Version"],
+                "Model": board["Model"] or "N/A",
+            }
+        return {}
+
+    def sound_devices(self):
+        devices = []
+        for sound in wmi_query("Win32_SoundDevice", ["Name", "Status", "Manufacturer"]):
+            devices.append({
+                "Name": sound["Name"],
+                "Status": sound["Status"],
+                "Manufacturer": sound["Manufacturer"]
+            })
+        return devices
+
+    def usb_devices(self):
+        """Build the USB tree from four batched queries instead of per-item lookups.
+
+        WMI doesn't expose hub parentage or link speed without a method call
+        per device, so external hubs and devices hang off their controller's
+        first root hub and every node's speed is reported as "Unknown".
+        Win32_USBController has no Service property; controller drivers come
+        from the matching Win32_PnPEntity (PNPClass 'USB', which includes
+        host controllers).
+        """
+        controllers = wmi_query("Win32_USBController", ["DeviceID", "Name", "Status"], cache=False)
+        services = {
+            e["DeviceID"]: e["Service"] for e in wmi_query(
+                "Win32_PnPEntity", ["DeviceID", "Service"], where="PNPClass = 'USB'", cache=False)
+        }
+        entities = {
+            e["DeviceID"]: e for e in wmi_query(
+                "Win32_PnPEntity", ["DeviceID", "Name", "Manufacturer", "Service", "Status"],
+                where="DeviceID LIKE 'USB%'", cache=False)
+        }
+        links = wmi_query("Win32_USBControllerDevice", ["Antecedent", "Dependent"], cache=False)
+
+        nodes = {}
+        for ctrl in controllers:
+            nodes[ctrl["DeviceID"]] = _usb_node(
+                "Controller", ctrl["Name"], ctrl["DeviceID"], driver=services.get(ctrl["DeviceID"]),
+                status=ctrl["Status"])
+
+        root_hubs = {}
+        attached = {}
+        interfaces = []
+        seen = set()
+        for link in links:
+            ctrl_id = wmi_ref_key(link["Antecedent"])
+            dev_id = wmi_ref_key(link["Dependent"])
+            entity = entities.get(dev_id)
+            if entity is None or dev_id in seen or ctrl_id not in nodes:
+                continue  # Not a USB-level device (e.g. HID\...), or a duplicate link
+            seen.add(dev_id)
+            if "&MI_" in dev_id.upper():
+                interfaces.append(entity)
+                continue
+            vid, pid = _usb_ids(dev_id)
+            if dev_id.upper().startswith("USB\\ROOT_HUB"):
+                kind = "Hub"
+            elif (entity["Service"] or "").upper().startswith("USBHUB"):
+                kind = "Hub"
+            else:
+                kind = "Device"
+            node = _usb_node(kind, entity["Name"], dev_id, vid, pid,
+                             driver=entity["Service"], manufacturer=entity["Manufacturer"],
+                             status=entity["Status"])
+            if dev_id.upper().startswith("USB\\ROOT_HUB"):
+                nodes[ctrl_id]["Children"].append(node)
+                root_hubs.setdefault(ctrl_id, node)
+            else:
+                attached.setdefault(ctrl_id, []).append(node)
+
+        by_ids = {}
+        for ctrl_id, children in attached.items():
+            parent = root_hubs.get(ctrl_id, nodes[ctrl_id])
+            parent["Children"].extend(children)
+            for node in children:
+                by_ids.setdefault((node["VID"], node["PID"]), node)
+
+        # Composite device functions (&MI_xx) only contribute their drivers
+        for entity in interfaces:
+            node = by_ids.get(_usb_ids(entity["DeviceID"]))
+            if node is not None and entity["Service"]:
+                drivers = [d for d in (node["Driver"] or "").split(", ") if d]
+                if entity["Service"] not in drivers:
+                    node["Driver"] = ", ".join(drivers + [entity["Service"]])
+
+        return list(nodes.values())
+
+class LinuxHardwareProvider:
+    """Hardware details read straight from procfs/sysfs (Linux).
+
+    Every path is resolved under root, so the provider can be pointed at a
+    recorded copy of /proc and /sys for tests and benchmarks.
+    """
+
+    name = "linux"
+
+    PCI_IDS_PATHS = ("usr/share/hwdata/pci.ids", "usr/share/misc/pci.ids", "usr/share/pci.ids")
+
+    def __init__(self, root="/"):
+        self.root = root
+        self._pci_names = {}
+
+    def _path(self, *parts):
+        return os.path.join(self.root, *parts)
+
+    def _link_name(self, *parts):
+        """Return the basename of a symlink's target, such as a device's driver"""
+        try:
+            return os.path.basename(os.readlink(self._path(*parts)))
+        except OSError:
+            return None
+
+    def _read(self, *parts, default=None):
+        """Return a stripped sysfs/procfs file, or default if it can't be read"""
+        try:
+            with open(self._path(*parts), encoding="utf-8", errors="replace") as f:
+                return f.read().strip()
+        except OSError:
+            return default
+
+    def _listdir(self, *parts):
+        try:
+            return sorted(os.listdir(self._path(*parts)))
+        except OSError:
+            return []
+
+    def _pci_name(self, vendor_id, device_id=None):
+        """Look up PCI vendor (and device) names in pci.ids, scanning the file once per id"""
+        key = (vendor_id, device_id)
+        if key in self._pci_names:
+            return self._pci_names[key]
+        vendor_name = device_name = None
+        for rel in self.PCI_IDS_PATHS:
+            try:
+                f = open(self._path(rel), encoding="utf-8", errors="replace")
+            except OSError:
+                continue
+            with f:
+                for line in f:
+                    if line.startswith("#") or not line.strip():
+                        continue
+                    if not line.startswith("\t"):
+                        if vendor_name is not None:
+                            break  # Left the vendor's block
+                        if line[:4].lower() == vendor_id:
+                            vendor_name = line[4:].strip()
+                            if device_id is None:
+                                break
+                    elif vendor_name is not None and not line.startswith("\t\t"):
+                        if line[1:5].lower() == device_id:
+                            device_name = line[5:].strip()
+                            break
+            break
+        self._pci_names[key] = (vendor_name, device_name)
+        return vendor_name, device_name
+
+    def _pci_ids(self, device_dir):
+        """Return (vendor_id, device_id) for a sysfs PCI device, without the 0x prefix"""
+        vendor = self._read(*device_dir, "vendor", default="")
+        device = self._read(*device_dir, "device", default="")
+        return vendor[2:].lower(), device[2:].lower()
+
+    def _parse_cpuinfo(self):
+        """Return the list of processor blocks in /proc/cpuinfo as dicts"""
+        text = self._read("proc", "cpuinfo", default="")
+        blocks = []
+        for chunk in text.split("\n\n"):
+            block = {}
+            for line in chunk.splitlines():
+                key, sep, value = line.partition(":")
+                if sep:
+                    block[key.strip()] = value.strip()
+            if block:
+                blocks.append(block)
+        return blocks
+
+    @staticmethod
+    def _count_cpu_list(cpu_list):
+        """Count CPUs in a sysfs CPU list such as '0-3,8-11'"""
+        count = 0
+        for part in cpu_list.split(","):
+            if "-" in part:
+                lo, hi = part.split("-")
+                count += int(hi) - int(lo) + 1
+            elif part:
+                count += 1
+        return count
+
+    def _cache_sizes(self, logical):
+        """Return {level: (KB per cache instance, instance count)} for cpu0's data caches"""
+        sizes = {}
+        base = ("sys", "devices", "system", "cpu", "cpu0", "cache")
+        for index in self._listdir(*base):
+            if not index.startswith("index"):
+                continue
+            if self._read(*base, index, "type") == "Instruction":
+                continue
+            level = self._read(*base, index, "level")
+            size = self._read(*base, index, "size", default="")
+            if not level or not size.endswith("K"):
+                continue
+            shared = self._read(*base, index, "shared_cpu_list", default="")
+            sharing = self._count_cpu_list(shared) if shared else 1
+            instances = max(1, logical // sharing) if logical else 1
+            sizes[int(level)] = (int(size[:-1]), instances)
+        return sizes
+
+    def cpu_info(self):
+        blocks = self._parse_cpuinfo()
+        if not blocks:
+            return {}
+        first = blocks[0]
+        logical = sum(1 for b in blocks if "processor" in b)
+        cores = {}
+        for b in blocks:
+            cores[b.get("physical id", "0")] = int(b.get("cpu cores", 0) or 0)
+        physical = sum(cores.values()) or logical
+        max_khz = self._read("sys", "devices", "system", "cpu", "cpu0", "cpufreq", "cpuinfo_max_freq")
+        current_mhz = first.get("cpu MHz")
+        caches = self._cache_sizes(logical)
+        l2, l3 = caches.get(2), caches.get(3)
+        return {
+            "Name": first.get("model name") or first.get("Processor") or platform.processor() or "Unknown",
+            "Manufacturer": first.get("vendor_id") or first.get("CPU implementer", "Unknown"),
+            "Cores (Physical)": physical,
+            "Threads (Logical)": logical,
+            "Max Clock Speed (MHz)": int(max_khz) // 1000 if max_khz else "Unknown",
+            "Current Clock Speed (MHz)": int(float(current_mhz)) if current_mhz else "Unknown",
+            "Architecture": platform.machine(),
+            "Processor ID": "Family {} Model {} Stepping {}".format(
+                first.get("cpu family", "?"), first.get("model", "?"), first.get("stepping", "?")),
+            "L2 Cache Size (KB)": l2[0] * l2[1] if l2 else "Unknown",
+            "L3 Cache Size (KB)": l3[0] * l3[1] if l3 else "Unknown",
+            "L3 Cache Per Instance (KB)": l3[0] if l3 else "Unknown",
+        }
+
+    def gpu_info(self):
+        gpus = []
+        for card in self._listdir("sys", "class", "drm"):
+            # Skip connector entries such as card0-HDMI-A-1
+            if not card.startswith("card") or "-" in card:
+                continue
+            device_dir = ("sys", "class", "drm", card, "device")
+            uevent = dict(
+                line.split("=", 1) for line in self._read(*device_dir, "uevent", default="").splitlines()
+                if "=" in line
+            )
+            vendor_id, device_id = self._pci_ids(device_dir)
+            vendor_name, device_name = self._pci_name(vendor_id, device_id) if vendor_id else (None, None)
+            name = " ".join(n for n in (vendor_name, device_name) if n) or uevent.get("PCI_ID", card)
+            driver = uevent.get("DRIVER")
+            vram = self._read(*device_dir, "mem_info_vram_total")
+
+            mode = "Unknown"
+            for connector in self._listdir("sys", "class", "drm"):
+                if connector.startswith(card + "-") and \
+                        self._read("sys", "class", "drm", connector, "status") == "connected":
+                    modes = self._read("sys", "class", "drm", connector, "modes", default="")
+                    if modes:
+                        mode = modes.splitlines()[0]
+                        break
+
+            gpus.append({
+                "Name": name,
+                "Driver Version": (self._read("sys", "module", driver, "version") if driver else None)
+                    or self._read("proc", "sys", "kernel", "osrelease", default="Unknown"),
+                "Video Processor": device_name or name,
+                "RAM (MB)": int(vram) // (1024*1024) if vram else "Unknown",
+                "Video Mode": mode,
+                "Status": "OK" if driver else "No driver",
+            })
+        return gpus
+
+    def bios_info(self):
+        dmi = ("sys", "class", "dmi", "id")
+        return {
+            "Manufacturer": self._read(*dmi, "bios_vendor", default="Unknown"),
+            "Version": self._read(*dmi, "bios_version", default="Unknown"),
+            "Release Date": self._read(*dmi, "bios_date", default="Unknown"),
+            # Serial numbers are only readable by root
+            "Serial Number": self._read(*dmi, "product_serial", default="N/A"),
+            "BIOS Language": "N/A",
+        }
+
+    def motherboard_info(self):
+        dmi = ("sys", "class", "dmi", "id")
+        return {
+            "Manufacturer": self._read(*dmi, "board_vendor", default="Unknown"),
+            "Product": self._read(*dmi, "board_name", default="Unknown"),
+            "Serial Number": self._read(*dmi, "board_serial", default="N/A"),
+            "Version": self._read(*dmi, "board_version", default="Unknown"),
+            "Model": "N/A",
+        }
+
+    def sound_devices(self):
+        import re
+        devices = []
+        # Lines look like: " 0 [PCH            ]: HDA-Intel - HDA Intel PCH"
+        pattern = re.compile(r"^\s*(\d+)\s+\[(.*?)\s*\]:\s*(.*?)\s+-\s+(.*)$")
+        for line in self._read("proc", "asound", "cards", default="").splitlines():
+            match = pattern.match(line)
+            if not match:
+                continue
+            number, _, driver, long_name = match.groups()
+            vendor_id, _ = self._pci_ids(("sys", "class", "sound", "card" + number, "device"))
+            vendor_name = self._pci_name(vendor_id)[0] if vendor_id else None
+            devices.append({
+                "Name": long_name,
+                "Status": "OK",
+                "Manufacturer": vendor_name or driver,
+            })
+        return devices
+
+    def usb_devices(self):
+        """Build the USB tree from one pass over /sys/bus/usb/devices"""
+        base = ("sys", "bus", "usb", "devices")
+        devices = {}
+        drivers = {}
+        for name in self._listdir(*base):
+            if ":" in name:
+                # Interface such as 1-1.2:1.0; its driver is the useful one
+                driver = self._link_name(*base, name, "driver")
+                owner = name.split(":")[0]
+                if owner.endswith("-0"):
+                    owner = "usb" + owner[:-2]  # Root hub interfaces are named 1-0:1.0
+                if driver and driver not in drivers.setdefault(owner, []):
+                    drivers[owner].append(driver)
+                continue
+            vid = self._read(*base, name, "idVendor")
+            pid = self._read(*base, name, "idProduct")
+            product = self._read(*base, name, "product")
+            manufacturer = self._read(*base, name, "manufacturer")
+            hub = self._read(*base, name, "bDeviceClass") == "09"
+            devices[name] = _usb_node(
+                "Hub" if hub else "Device",
+                product or f"USB device {vid}:{pid}",
+                name,
+                vid.upper() if vid else None, pid.upper() if pid else None,
+                speed=self._read(*base, name, "speed"),
+                manufacturer=manufacturer,
+            )
+
+        controllers = {}
+        for name, node in devices.items():
+            node["Driver"] = ", ".join(drivers.get(name, [])) or None
+            if name.startswith("usb"):
+                # Root hub: its parent directory is the host controller
+                ctrl_dir = os.path.dirname(os.path.realpath(self._path(*base, name)))
+                ctrl = controllers.get(ctrl_dir)
+                if ctrl is None:
+                    vendor_id, device_id = self._pci_ids((ctrl_dir,))
+                    vendor_name, device_name = self._pci_name(vendor_id, device_id) if vendor_id else (None, None)
+                    ctrl = controllers[ctrl_dir] = _usb_node(
+                        "Controller",
+                        device_name or node["Name"],
+                        os.path.basename(ctrl_dir),
+                        driver=self._link_name(ctrl_dir, "driver"),
+                        manufacturer=vendor_name,
+                    )
+                ctrl["Children"].append(node)
+                continue
+            # 1-1.2 hangs off hub 1-1, and 1-1 off root hub usb1
+            port_path = name.split("-", 1)
+            parent = name.rsplit(".", 1)[0] if "." in name else f"usb{port_path[0]}"
+            if parent in devices:
+                devices[parent]["Children"].append(node)
+
+        return list(controllers.values())
+
+# Provider classes by name; register_provider() adds more
+HARDWARE_PROVIDERS = {
+    WMIHardwareProvider.name: WMIHardwareProvider,
+    LinuxHardwareProvider.name: LinuxHardwareProvider,
+}
+
+_hardware_provider = None
+
+def register_provider(name, provider_class):
+    """Make a provider class selectable by name"""
+    HARDWARE_PROVIDERS[name] = provider_class
+
+def default_provider_name():
+    """Return the provider name that suits the running OS"""
+    system = platform.system()
+    if system == "Windows":
+        return "wmi"
+    if system == "Linux":
+        return "linux"
+    raise RuntimeError(f"No hardware provider for {system}")
+
+def set_hardware_provider(provider):
+    """Switch the provider backing the hardware collectors (name or instance)"""
+    global _hardware_provider
+    if isinstance(provider, str):
+        if provider not in HARDWARE_PROVIDERS:
+            raise ValueError(f"Unknown hardware provider: {provider}")
+        provider = HARDWARE_PROVIDERS[provider]()
+    _hardware_provider = provider
+    snapshot_cache.invalidate()
+    clear_wql_cache()
+
+def get_hardware_provider():
+    """Return the active provider, creating the OS default on first use"""
+    global _hardware_provider
+    if _hardware_provider is None:
+        _hardware_provider = HARDWARE_PROVIDERS[default_provider_name()]()
+    return _hardware_provider
+
 # --------------------------
 # Hardware Info Collectors
 # --------------------------
@@ -37,20 +884,7 @@ def get_cpu_info():
     """Return detailed CPU info"""
     cpu_data = {}
     try:
-        for cpu in c.Win32_Processor():
-            cpu_data = {
-                "Name": cpu.Name.strip(),
-                "Manufacturer": cpu.Manufacturer,
-                "Cores (Physical)": cpu.NumberOfCores,
-                "Threads (Logical)": cpu.NumberOfLogicalProcessors,
-                "Max Clock Speed (MHz)": cpu.MaxClockSpeed,
-                "Current Clock Speed (MHz)": cpu.CurrentClockSpeed,
-                "Architecture": cpu.Architecture,
-                "Processor ID": cpu.ProcessorId,
-                "L2 Cache Size (KB)": cpu.L2CacheSize,
-                "L3 Cache Size (KB)": cpu.L3CacheSize,
-            }
-            break
+        cpu_data = get_hardware_provider().cpu_info()
     except Exception as e:
         cpu_data["Error"] = f"Failed to get CPU info: {str(e)}"
     return cpu_data
@@ -59,15 +893,7 @@ def get_gpu_info():
     """Return list of GPU info dicts"""
     gpus = []
     try:
-        for gpu in c.Win32_VideoController():
-            gpus.append({
-                "Name": gpu.Name,
-                "Driver Version": gpu.DriverVersion,
-                "Video Processor": gpu.VideoProcessor,
-                "RAM (MB)": int(gpu.AdapterRAM) // (1024*1024) if gpu.AdapterRAM else "Unknown",
-                "Video Mode": gpu.VideoModeDescription,
-                "Status": gpu.Status
-            })
+        gpus = get_hardware_provider().gpu_info()
     except Exception as e:
         gpus.append({"Error": f"Failed to get GPU info: {str(e)}"})
     return gpus
@@ -89,24 +915,80 @@ def get_ram_info():
     except Exception as e:
         return {"Error": f"Failed to get RAM info: {str(e)}"}
 
-def get_disk_info():
-    """Return disk partitions and usage"""
+DISK_USAGE_TIMEOUT = 2.0  # seconds per mountpoint
+# A mountpoint whose usage query hung is reported "unavailable" this long before being retried
+UNAVAILABLE_MOUNT_RETRY = 60.0  # seconds
+_unavailable_mounts = {}  # mountpoint -> time.monotonic() when it may be retried
+_usage_probes = {}  # mountpoint -> probe still running
+_usage_lock = threading.Lock()
+
+def _probe_disk_usage(mountpoint):
+    """Start psutil.disk_usage(mountpoint) on a daemon thread, reusing one still in flight.
+
+    Daemon threads are used because a statvfs() on a dead network mount
+    can't be interrupted, and a hung pool thread would block interpreter exit.
+    """
+    with _usage_lock:
+        probe = _usage_probes.get(mountpoint)
+        if probe is not None:
+            return probe
+        probe = {"done": threading.Event(), "usage": None, "error": None}
+        _usage_probes[mountpoint] = probe
+
+    def run():
+        try:
+            probe["usage"] = psutil.disk_usage(mountpoint)
+        except Exception as e:
+            probe["error"] = e
+        with _usage_lock:
+            _usage_probes.pop(mountpoint, None)
+            if probe["usage"] is not None:
+                _unavailable_mounts.pop(mountpoint, None)  # Came back after all
+        probe["done"].set()
+
+    threading.Thread(target=run, name=f"disk-usage {mountpoint}", daemon=True).start()
+    return probe
+
+def get_disk_info(timeout=DISK_USAGE_TIMEOUT):
+    """Return disk partitions and usage, querying every mountpoint in parallel"""
     disks = []
     try:
         partitions = psutil.disk_partitions()
-        for p in partitions:
-            usage = psutil.disk_usage(p.mountpoint)
-            disks.append({
-                "Device": p.device,
-                "Mountpoint": p.mountpoint,
-                "File System": p.fstype,
+    except Exception as e:
+        disks.append({"Error": f"Failed to get disk info: {str(e)}"})
+        return disks
+
+    now = time.monotonic()
+    probes = []
+    for p in partitions:
+        with _usage_lock:
+            retry_at = _unavailable_mounts.get(p.mountpoint, 0)
+        probes.append(_probe_disk_usage(p.mountpoint) if retry_at <= now else None)
+
+    deadline = now + timeout
+    for p, probe in zip(partitions, probes):
+        disk = {
+            "Device": p.device,
+            "Mountpoint": p.mountpoint,
+            "File System": p.fstype,
+        }
+        if probe is None:
+            disk["Error"] = "Unavailable (timed out recently)"
+        elif not probe["done"].wait(max(0.0, deadline - time.monotonic())):
+            with _usage_lock:
+                _unavailable_mounts[p.mountpoint] = time.monotonic() + UNAVAILABLE_MOUNT_RETRY
+            disk["Error"] = f"Timed out after {timeout}s"
+        elif probe["error"] is not None:
+            disk["Error"] = f"Failed to get usage: {str(probe['error'])}"
+        else:
+            usage = probe["usage"]
+            disk.update({
                 "Total Size (GB)": round(usage.total / (1024 ** 3), 2),
                 "Used (GB)": round(usage.used / (1024 ** 3), 2),
                 "Free (GB)": round(usage.free / (1024 ** 3), 2),
                 "Usage (%)": usage.percent,
             })
-    except Exception as e:
-        disks.append({"Error": f"Failed to get disk info: {str(e)}"})
+        disks.append(disk)
     return disks
 
 def get_network_info():
@@ -133,15 +1015,7 @@ def get_bios_info():
     """Return BIOS info from WMI"""
     bios_data = {}
     try:
-        for bios in c.Win32_BIOS():
-            bios_data = {
-                "Manufacturer": bios.Manufacturer,
-                "Version": bios.SMBIOSBIOSVersion,
-                "Release Date": bios.ReleaseDate,
-                "Serial Number": bios.SerialNumber,
-                "BIOS Language": bios.BIOSLanguage if hasattr(bios, 'BIOSLanguage') else "N/A"
-            }
-            break
+        bios_data = get_hardware_provider().bios_info()
     except Exception as e:
         bios_data["Error"] = f"Failed to get BIOS info: {str(e)}"
     return bios_data
@@ -150,15 +1024,7 @@ def get_motherboard_info():
     """Return motherboard info"""
     board_data = {}
     try:
-        for board in c.Win32_BaseBoard():
-            board_data = {
-                "Manufacturer": board.Manufacturer,
-                "Product": board.Product,
-                "Serial Number": board.SerialNumber,
-                "Version": board.Version,
-                "Model": board.Model if hasattr(board, 'Model') else "N/A",
-            }
-            break
+        board_data = get_hardware_provider().motherboard_info()
     except Exception as e:
         board_data["Error"] = f"Failed to get Motherboard info: {str(e)}"
     return board_data
@@ -167,12 +1033,7 @@ def get_sound_devices():
     """Return list of sound devices info"""
     devices = []
     try:
-        for sound in c.Win32_SoundDevice():
-            devices.append({
-                "Name": sound.Name,
-                "Status": sound.Status,
-                "Manufacturer": sound.Manufacturer
-            })
+        devices = get_hardware_provider().sound_devices()
     except Exception as e:
         devices.append({"Error": f"Failed to get Sound Devices info: {str(e)}"})
     return devices
@@ -192,13 +1053,6 @@ def get_battery_info():
     except Exception as e:
         return {"Error": f"Failed to get battery info: {str(e)}"}
 
-def get_process_count():
-    """Return number of running processes"""
-    try:
-        return {"Running Processes": len(psutil.pids())}
-    except Exception as e:
-        return {"Error": f"Failed to get process count: {str(e)}"}
-
 def get_boot_time():
     """Return system boot time as human-readable string"""
     try:
@@ -208,46 +1062,818 @@ def get_boot_time():
     except Exception as e:
         return {"Error": f"Failed to get boot time: {str(e)}"}
 
+# --------------------------
+# Snapshot Cache
+# --------------------------
+
+# Collectors whose values can't change before a reboot
+STATIC_COLLECTORS = {
+    get_cpu_info,
+    get_bios_info,
+    get_motherboard_info,
+    get_gpu_info,
+    get_sound_devices,
+}
+
+# Collectors that go stale quickly and are only cached for a short TTL
+VOLATILE_COLLECTORS = {
+    get_ram_info,
+    get_disk_info,
+}
+
+DEFAULT_VOLATILE_TTL = 2.0  # seconds
+BOOT_TIME_CHECK_INTERVAL = 1.0  # seconds between psutil.boot_time() checks
+
+def _has_error(result):
+    """Return True if a collector result carries an Error entry"""
+    if isinstance(result, dict):
+        return "Error" in result
+    if isinstance(result, list):
+        return any(isinstance(item, dict) and "Error" in item for item in result)
+    return False
+
+class SnapshotCache:
+    """Cache collector results: static ones until reboot, volatile ones for a TTL.
+
+    Collectors that are neither static nor volatile are called straight
+    through. Results carrying an Error are never cached. Cached results are
+    shared, so callers must not mutate them.
+    """
+
+    def __init__(self, ttl=DEFAULT_VOLATILE_TTL, ttls=None,
+                 static=STATIC_COLLECTORS, volatile=VOLATILE_COLLECTORS):
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.static = set(static)
+        self.volatile = set(volatile)
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._boot_time = None
+        self._boot_checked = 0.0
+
+    def _current_boot_time(self):
+        """Return psutil.boot_time(), re-read at most once per check interval"""
+        now = time.monotonic()
+        if self._boot_time is None or now - self._boot_checked >= BOOT_TIME_CHECK_INTERVAL:
+            try:
+                # Rounded since Windows derives it from uptime and it can jitter
+                self._boot_time = round(psutil.boot_time())
+            except Exception:
+                self._boot_time = 0
+            self._boot_checked = now
+        return self._boot_time
+
+    def _is_fresh(self, collector, entry):
+        stamp, result = entry
+        if collector in self.static:
+            return stamp == self._current_boot_time()
+        ttl = self.ttls.get(collector, self.ttl)
+        return time.monotonic() - stamp < ttl
+
+    def get(self, collector):
+        """Return the collector's result, calling it only if the cached copy is stale"""
+        if collector not in self.static and collector not in self.volatile:
+            return collector()
+
+        with self._lock:
+            entry = self._entries.get(collector)
+            if entry is not None and self._is_fresh(collector, entry):
+                return entry[1]
+
+        result = collector()
+        if not _has_error(result):
+            if collector in self.static:
+                stamp = self._current_boot_time()
+            else:
+                stamp = time.monotonic()
+            with self._lock:
+                self._entries[collector] = (stamp, result)
+        return result
+
+    def invalidate(self, collector=None):
+        """Drop one collector's cached result, or everything if collector is None"""
+        with self._lock:
+            if collector is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(collector, None)
+
+# Shared cache used by the GUI
+snapshot_cache = SnapshotCache()
+
 # --------------------------
 # Benchmark Functions
 # --------------------------
 
-def cpu_benchmark(duration=3):
-    """Simple CPU benchmark by busy loop"""
-    end = time.time() + duration
-    count = 0
-    while time.time() < end:
-        count += 1  # Simulate work
-        _ = count ** 0.5
-    return {"CPU Benchmark (loops in {}s)".format(duration): count}
-
-def memory_benchmark():
-    """Simple memory benchmark by reading a large bytearray"""
-    data = bytearray(100_000_000)
-    start = time.time()
-    s = sum(data)
-    elapsed = time.time() - start
-    return {"Memory Benchmark (sum bytes)": f"{elapsed:.4f} seconds"}
-
-def disk_benchmark():
-    """Simple disk write/read benchmark using temp file"""
+class BenchmarkCancelled(Exception):
+    """Raised inside a benchmark when its run has been cancelled"""
+
+class CancellationToken:
+    """Thread-safe flag a benchmark run checks to stop early"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+# The token of the run the current thread is working for, if any
+_benchmark_context = threading.local()
+
+def check_cancelled():
+    """Raise BenchmarkCancelled if the current thread's benchmark run was cancelled"""
+    token = getattr(_benchmark_context, "token", None)
+    if token is not None and token.cancelled:
+        raise BenchmarkCancelled("Benchmark cancelled")
+
+def format_size(nbytes):
+    """Return a byte count as a short human-readable string (e.g. 256 KB)"""
+    for unit in ("B", "KB", "MB", "GB"):
+        if nbytes < 1024 or unit == "GB":
+            return f"{nbytes:g} {unit}" if unit == "B" else f"{nbytes:.0f} {unit}"
+        nbytes /= 1024
+
+BENCHMARK_MIN_CALIBRATION_TIME = 0.01  # seconds a calibration probe must run to be trusted
+
+TIMER_CLOCKS = {
+    "perf_counter": time.perf_counter_ns,
+    "monotonic": time.monotonic_ns,
+    "process_time": time.process_time_ns,
+}
+TIMER_CALIBRATION_SAMPLES = 20000
+MIN_TRUSTED_TICKS = 1000  # a timed batch must span this many perf_counter ticks
+MIN_TRUSTED_OVERHEADS = 100  # ... and this many times the per-batch timing overhead
+
+_timer_calibration = None
+_timer_calibration_uses = 0  # timer_calibration() calls, so a run can tell whether it used it
+_timer_calibration_lock = threading.Lock()
+
+def _clock_resolution(clock, samples, limit_ns=500_000_000):
+    """Smallest nonzero step between consecutive clock readings (ns), or None"""
+    best = None
+    last = clock()
+    deadline = time.perf_counter_ns() + limit_ns
+    taken = 0
+    # A coarse clock (e.g. process_time on Windows) may need more samples to tick once
+    while taken < samples or (best is None and time.perf_counter_ns() < deadline):
+        now = clock()
+        taken += 1
+        if now != last:
+            best = now - last if best is None else min(best, now - last)
+            last = now
+    return best
+
+def calibrate_timers(samples=TIMER_CALIBRATION_SAMPLES):
+    """Measure every clock's effective resolution and per-call cost, the empty-loop cost,
+    and the fixed overhead benchmark_kernel pays per timed batch (all in ns)"""
+    def noop(n):
+        pass
+
+    loop = range(samples)
+    start = time.perf_counter_ns()
+    for _ in loop:
+        pass
+    empty_loop = (time.perf_counter_ns() - start) / samples
+
+    clocks = {}
+    for name, clock in TIMER_CLOCKS.items():
+        start = time.perf_counter_ns()
+        for _ in loop:
+            clock()
+        per_call = (time.perf_counter_ns() - start) / samples - empty_loop
+        clocks[name] = {
+            "implementation": time.get_clock_info(name).implementation,
+            "reported_resolution_ns": time.get_clock_info(name).resolution * 1e9,
+            "resolution_ns": _clock_resolution(clock, samples),
+            "overhead_ns": max(per_call, 0.0),
+        }
+
+    # What an empty kernel measures in benchmark_kernel's timing pattern
+    batch_overhead = None
+    for _ in range(1000):
+        start = time.perf_counter_ns()
+        noop(1)
+        elapsed = time.perf_counter_ns() - start
+        batch_overhead = elapsed if batch_overhead is None else min(batch_overhead, elapsed)
+    resolution = clocks["perf_counter"]["resolution_ns"] or 1
+    return {
+        "clocks": clocks,
+        "empty_loop_ns": empty_loop,
+        "batch_overhead_ns": batch_overhead,
+        "min_trusted_ns": max(MIN_TRUSTED_TICKS * resolution, MIN_TRUSTED_OVERHEADS * batch_overhead),
+    }
+
+def timer_calibration():
+    """Return this process's timer calibration, measuring it on first use"""
+    global _timer_calibration, _timer_calibration_uses
+    with _timer_calibration_lock:
+        if _timer_calibration is None:
+            _timer_calibration = calibrate_timers()
+        _timer_calibration_uses += 1
+        return _timer_calibration
+
+def corrected_ns(elapsed_ns, iterations=0):
+    """Subtract the calibrated timing overhead and iterations x the empty-loop cost from a
+    perf_counter_ns span; raise ValueError if the span is too short to trust"""
+    calibration = timer_calibration()
+    if elapsed_ns < calibration["min_trusted_ns"]:
+        raise ValueError(f"timed span of {elapsed_ns} ns is below the "
+                         f"{calibration['min_trusted_ns']:.0f} ns this timer can measure reliably")
+    overhead = calibration["batch_overhead_ns"] + iterations * calibration["empty_loop_ns"]
+    return max(elapsed_ns - overhead, 1)
+
+def _clocksource():
+    """Kernel clock source on Linux (tsc, hpet, ...); VMs sometimes fall back to slow ones"""
+    try:
+        with open("/sys/devices/system/clocksource/clocksource0/current_clocksource") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def applied_timer_report(since=0):
+    """This process's calibration if it was used after the first `since` uses, else None"""
+    if _timer_calibration_uses <= since:
+        return None
+    return timer_report(_timer_calibration)["Timer Calibration"]
+
+def timer_report(calibration=None):
+    """Format a timer calibration for display and export"""
+    calibration = calibration or timer_calibration()
+    report = {}
+    for name, clock in calibration["clocks"].items():
+        resolution = clock["resolution_ns"]
+        report[name] = {
+            "Implementation": clock["implementation"],
+            "Reported Resolution (ns)": round(clock["reported_resolution_ns"], 1),
+            "Measured Resolution (ns)": round(resolution, 1) if resolution else "Not observed",
+            "Call Overhead (ns)": round(clock["overhead_ns"], 1),
+        }
+    report["Empty Loop (ns/iteration)"] = round(calibration["empty_loop_ns"], 1)
+    report["Batch Overhead Subtracted (ns)"] = calibration["batch_overhead_ns"]
+    report["Shortest Trusted Batch (us)"] = round(calibration["min_trusted_ns"] / 1e3, 1)
+    clocksource = _clocksource()
+    if clocksource:
+        report["Clock Source"] = clocksource
+    return {"Timer Calibration": report}
+
+def calibrate_batch(kernel, target=0.2):
+    """Return the iteration count that makes one kernel(n) call take about target seconds"""
+    n = 1
+    while True:
+        start = time.perf_counter_ns()
+        kernel(n)
+        elapsed = time.perf_counter_ns() - start
+        if elapsed >= BENCHMARK_MIN_CALIBRATION_TIME * 1e9:
+            return max(1, round(n * target * 1e9 / elapsed))
+        # Grow quickly while the probe is far too short, then more carefully
+        n *= 10 if elapsed < BENCHMARK_MIN_CALIBRATION_TIME * 1e8 else 2
+
+def benchmark_kernel(kernel, warmup=1, repetitions=5, batch=None, target=0.2):
+    """Time repeated fixed-size batches of kernel(batch) and return their statistics.
+
+    Only the kernel call sits between the two clock reads, so clock overhead
+    is paid twice per batch instead of once per iteration, and that measured
+    overhead is subtracted from every timing. Batches shorter than the
+    calibration's shortest trusted time are rerun once, scaled up, and
+    rejected with ValueError if still too short.
+    """
+    import math
+    import statistics
+    calibration = timer_calibration()
+    overhead = calibration["batch_overhead_ns"]
+    shortest = calibration["min_trusted_ns"]
+    if batch is None:
+        batch = calibrate_batch(kernel, target)
+    for _ in range(warmup):
+        kernel(batch)
+    for attempt in range(2):
+        times = []
+        for _ in range(repetitions):
+            check_cancelled()
+            start = time.perf_counter_ns()
+            kernel(batch)
+            times.append(max(time.perf_counter_ns() - start - overhead, 1))
+        if min(times) >= shortest:
+            break
+        if attempt == 1:
+            raise ValueError(f"batches of {batch} ran {min(times)} ns, "
+                             f"below the {shortest:.0f} ns this timer can measure reliably")
+        batch *= math.ceil(10 * shortest / min(times))
+    median = statistics.median(times)
+    return {
+        "batch": batch,
+        "times_ns": times,
+        "median_ns": median,
+        "min_ns": min(times),
+        "stddev_ns": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "ops_per_sec": batch / (median / 1e9),
+        "overhead_ns": overhead,
+    }
+
+def kernel_report(stats):
+    """Format benchmark_kernel() statistics for display and export"""
+    return {
+        "Ops/s (median)": round(stats["ops_per_sec"]),
+        "Ops/s (best)": round(stats["batch"] / (stats["min_ns"] / 1e9)),
+        "Batch Size (ops)": stats["batch"],
+        "Median Batch (ms)": round(stats["median_ns"] / 1e6, 3),
+        "Min Batch (ms)": round(stats["min_ns"] / 1e6, 3),
+        "Stddev (ms)": round(stats["stddev_ns"] / 1e6, 3),
+        "Repetitions": len(stats["times_ns"]),
+    }
+
+def cpu_kernel(n):
+    """Square roots of n integers"""
+    for i in range(n):
+        _ = i ** 0.5
+
+def cpu_benchmark(duration=3, repetitions=5, warmup=1):
+    """CPU benchmark: calibrated square-root batches, about duration seconds in total"""
+    stats = benchmark_kernel(cpu_kernel, warmup, repetitions, target=duration / (warmup + repetitions))
+    return {"CPU Benchmark": kernel_report(stats)}
+
+# Fallback cache sizes when the CPU info doesn't report them
+DEFAULT_L2_PER_CORE_KB = 256
+DEFAULT_L3_KB = 8192
+
+def l3_instance_kb(cpu_info):
+    """Return the KB of one L3 instance a single thread can use, or None if unknown"""
+    l3 = cpu_info.get("L3 Cache Per Instance (KB)")
+    if not isinstance(l3, int):
+        l3 = cpu_info.get("L3 Cache Size (KB)")
+    return l3 if isinstance(l3, int) and l3 > 0 else None
+
+def stream_working_sets(cpu_info=None):
+    """Return {level: bytes} working sets that sit inside L2, inside L3, and well past L3.
+
+    WMI and the Linux provider report L2 summed over all cores, so the L2 set
+    is sized from one core's share because the suite runs on a single core.
+    L3 is sized from one cache instance (one socket or die) for the same reason.
+    """
+    cpu_info = cpu_info if cpu_info is not None else snapshot_cache.get(get_cpu_info)
+    l2, l3 = cpu_info.get("L2 Cache Size (KB)"), l3_instance_kb(cpu_info)
+    cores = cpu_info.get("Cores (Physical)")
+    if isinstance(l2, int) and l2 > 0:
+        l2_kb = l2 // cores if isinstance(cores, int) and cores > 0 else l2
+    else:
+        l2_kb = DEFAULT_L2_PER_CORE_KB
+    l3_kb = l3 if isinstance(l3, int) and l3 > l2_kb else max(DEFAULT_L3_KB, l2_kb * 4)
+    dram = max(l3_kb * 1024 * 4, 256 * 1024 ** 2)
+    try:
+        dram = min(dram, psutil.virtual_memory().available // 4)
+    except Exception:
+        pass
+    return {
+        "L2": l2_kb * 1024 // 2,
+        "L3": l3_kb * 1024 // 2,
+        "DRAM": dram,
+    }
+
+def _best_rate(op, nbytes, repetitions):
+    """Return the best GB/s of op() over repetitions, batching calls so each timing lasts >= 10 ms"""
+    overhead = timer_calibration()["batch_overhead_ns"]
+    inner = 1
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(inner):
+            op()
+        elapsed = time.perf_counter_ns() - start - overhead
+        if elapsed >= 10_000_000:
+            break
+        inner *= 2
+    best = elapsed / inner
+    for _ in range(repetitions):
+        start = time.perf_counter_ns()
+        for _ in range(inner):
+            op()
+        best = min(best, (time.perf_counter_ns() - start - overhead) / inner)
+    return round(nbytes / best, 2)  # bytes per ns == GB/s
+
+def memory_benchmark(working_sets=None, repetitions=5):
+    """STREAM-style copy/scale/add/triad bandwidth for L2, L3 and DRAM working sets.
+
+    Byte counts follow STREAM's convention (2 arrays for copy/scale, 3 for
+    add/triad). Arrays are filled before timing so every page is faulted in.
+    """
+    working_sets = working_sets or stream_working_sets()
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    def copy_rates(total):
+        # Without NumPy only a memoryview copy runs at memory speed
+        n = total // 2
+        src = memoryview(bytearray(b"\x01") * n)
+        dst = memoryview(bytearray(b"\x02") * n)
+
+        def copy():
+            dst[:] = src
+        return {"Copy": _best_rate(copy, 2 * n, repetitions)}
+
+    def stream_rates(total):
+        # The arrays are freed when this returns, before the next working set is allocated
+        n = max(1, total // (3 * 8))  # three float64 arrays
+        a, b, c = np.full(n, 1.0), np.full(n, 2.0), np.full(n, 0.0)
+        scalar = 3.0
+        word = a.itemsize
+
+        def triad():
+            np.multiply(c, scalar, out=a)
+            np.add(a, b, out=a)
+        return {
+            "Copy": _best_rate(lambda: np.copyto(c, a), 2 * word * n, repetitions),
+            "Scale": _best_rate(lambda: np.multiply(c, scalar, out=b), 2 * word * n, repetitions),
+            "Add": _best_rate(lambda: np.add(a, b, out=c), 3 * word * n, repetitions),
+            "Triad": _best_rate(triad, 3 * word * n, repetitions),
+        }
+
+    results = {}
+    try:
+        for level, total in working_sets.items():
+            label = f"{level} ({total // 1024} KB working set)"
+            results[label] = copy_rates(total) if np is None else stream_rates(total)
+        return {"Memory Bandwidth (GB/s)": results}
+    except Exception as e:
+        return {"Error": f"Failed memory benchmark: {str(e)}"}
+
+# (name, mode, pattern, block size, queue depth) for the default storage run
+STORAGE_TESTS = [
+    ("Sequential Read 1M", "read", "sequential", 1024 ** 2, 1),
+    ("Sequential Write 1M", "write", "sequential", 1024 ** 2, 1),
+    ("Random Read 4K QD1", "read", "random", 4096, 1),
+    ("Random Read 4K QD8", "read", "random", 4096, 8),
+    ("Random Write 4K QD8", "write", "random", 4096, 8),
+]
+
+# Target menu entry for benchmark_dir(None): the temp directory
+BENCHMARK_DEFAULT_TARGET = "Temp Directory"
+
+def benchmark_targets():
+    """Return mountpoints from get_disk_info that can take a benchmark file"""
+    return [
+        d["Mountpoint"] for d in get_disk_info()
+        if "Error" not in d and os.access(d["Mountpoint"], os.W_OK)
+    ]
+
+def benchmark_dir(mountpoint=None):
+    """Return a writable directory on mountpoint, or the temp dir when none is given"""
+    import tempfile
+    tmp = tempfile.gettempdir()
+    if mountpoint is None:
+        return tmp
+    if mountpoint not in {d.get("Mountpoint") for d in get_disk_info()}:
+        raise ValueError(f"Not a mounted disk: {mountpoint}")
+    # Prefer the temp dir when it lives on the requested mount
+    if os.stat(tmp).st_dev == os.stat(mountpoint).st_dev:
+        return tmp
+    return mountpoint
+
+def _percentiles(samples, points=(50, 90, 99, 99.9)):
+    """Return {"pXX": value} for sorted samples plus the maximum"""
+    result = {}
+    for p in points:
+        index = min(len(samples) - 1, int(round(p / 100 * (len(samples) - 1))))
+        result[f"p{p:g}"] = samples[index]
+    result["max"] = samples[-1]
+    return result
+
+def _prepare_test_file(directory, file_size, chunk=1024 ** 2):
+    """Create a file_size file of incompressible data, flushed to disk"""
     import tempfile
-    import os
+    fd, path = tempfile.mkstemp(prefix="hardwarehouse-", suffix=".bench", dir=directory)
+    try:
+        data = os.urandom(chunk)
+        written = 0
+        while written < file_size:
+            written += os.write(fd, data[:min(chunk, file_size - written)])
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    return path
+
+def _open_test_file(path, direct):
+    """Open path for raw I/O; returns (fd, whether O_DIRECT is in effect)"""
+    flags = os.O_RDWR | getattr(os, "O_BINARY", 0)
+    if direct and hasattr(os, "O_DIRECT"):
+        try:
+            return os.open(path, flags | os.O_DIRECT), True
+        except OSError:
+            pass  # e.g. tmpfs doesn't support O_DIRECT
+    return os.open(path, flags), False
+
+def _drop_cached_pages(fd):
+    """Ask the OS to evict the file from the page cache where that's possible"""
+    if hasattr(os, "posix_fadvise"):
+        os.fsync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+def _storage_worker(path, fd, mode, pattern, block_size, blocks, next_block, deadline, seed):
+    """Issue I/O until the deadline (or the end of the file when sequential); returns latencies in ns"""
+    import mmap
+    import random
+    buf = mmap.mmap(-1, block_size)  # Page-aligned, as O_DIRECT requires
+    buf.write(os.urandom(block_size))
+    rng = random.Random(seed)
+    overhead = timer_calibration()["batch_overhead_ns"]  # what the two clock reads cost
+    latencies = []
+    own_file = None
+    if not hasattr(os, "preadv"):
+        # No positional I/O (Windows): give each worker its own handle to seek
+        own_file = open(path, "r+b", buffering=0)
     try:
-        tmp_file = tempfile.NamedTemporaryFile(delete=False)
-        filename = tmp_file.name
-        tmp_file.close()
-        data = b"x" * (10**7)  # 10 MB
-        start = time.time()
-        with open(filename, "wb") as f:
-            f.write(data)
-        with open(filename, "rb") as f:
-            content = f.read()
-        elapsed = time.time() - start
-        os.remove(filename)
-        return {"Disk Benchmark (write/read 10MB)": f"{elapsed:.4f} seconds"}
+        while True:
+            if pattern == "random":
+                offset = rng.randrange(blocks) * block_size
+            else:
+                offset = next_block()
+                if offset is None:
+                    break
+                offset *= block_size
+            start = time.perf_counter_ns()
+            if own_file is not None:
+                own_file.seek(offset)
+                if mode == "read":
+                    own_file.readinto(buf)
+                else:
+                    own_file.write(buf)
+            elif mode == "read":
+                os.preadv(fd, [buf], offset)
+            else:
+                os.pwritev(fd, [buf], offset)
+            end = time.perf_counter_ns()
+            latencies.append(max(end - start - overhead, 1))
+            if end >= deadline:
+                break
+    finally:
+        if own_file is not None:
+            own_file.close()
+        buf.close()
+    return latencies
+
+def storage_test(path, mode="read", pattern="random", block_size=4096, queue_depth=1,
+                 duration=3.0, fsync=True, direct=True):
+    """Run one read or write test against an existing file and return its figures.
+
+    queue_depth threads keep that many requests in flight (the GIL is released
+    during each syscall). Writes are fsynced before the clock stops when fsync
+    is set. Buffered reads start from an evicted page cache where possible.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    file_size = os.path.getsize(path)
+    blocks = max(1, file_size // block_size)
+    fd, direct_on = _open_test_file(path, direct)
+    try:
+        if mode == "read" and not direct_on:
+            _drop_cached_pages(fd)
+        lock = threading.Lock()
+        counter = iter(range(blocks))
+
+        def next_block():
+            with lock:
+                return next(counter, None)
+
+        start = time.perf_counter_ns()
+        deadline = start + int(duration * 1e9)
+        with ThreadPoolExecutor(max_workers=queue_depth) as pool:
+            futures = [
+                pool.submit(_storage_worker, path, fd, mode, pattern, block_size,
+                            blocks, next_block, deadline, seed)
+                for seed in range(queue_depth)
+            ]
+            latencies = [ns for f in futures for ns in f.result()]
+        if mode == "write" and fsync:
+            os.fsync(fd)
+        elapsed = (time.perf_counter_ns() - start) / 1e9
+    finally:
+        os.close(fd)
+
+    latencies.sort()
+    ops = len(latencies)
+    return {
+        "Block Size": format_size(block_size),
+        "Queue Depth": queue_depth,
+        "Direct I/O": "On" if direct_on else "Off",
+        "Ops": ops,
+        "MB/s": round(ops * block_size / elapsed / 1e6, 2),
+        "IOPS": round(ops / elapsed),
+        "Latency (us)": {k: round(v / 1000, 1) for k, v in _percentiles(latencies).items()},
+    }
+
+def storage_benchmark(mountpoint=None, tests=STORAGE_TESTS, file_size=256 * 1024 ** 2,
+                      duration=3.0, fsync=True, direct=True):
+    """Run the storage tests against one test file on mountpoint (a get_disk_info mountpoint)"""
+    path = None
+    try:
+        directory = benchmark_dir(mountpoint)
+        path = _prepare_test_file(directory, file_size)
+        results = {"Target": directory, "File Size": format_size(file_size)}
+        for name, mode, pattern, block_size, queue_depth in tests:
+            results[name] = storage_test(path, mode, pattern, block_size, queue_depth,
+                                         duration, fsync, direct)
+        return {"Storage Benchmark": results}
     except Exception as e:
-        return {"Disk Benchmark Error": str(e)}
+        return {"Error": f"Failed storage benchmark: {str(e)}"}
+    finally:
+        if path is not None:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+def _read_with_read(path, chunk):
+    with open(path, "rb", buffering=0) as f:
+        while f.read(chunk):
+            pass
+
+def _read_with_readinto(path, chunk):
+    buf = memoryview(bytearray(chunk))
+    with open(path, "rb", buffering=0) as f:
+        while f.readinto(buf):
+            pass
+
+def _read_with_preadv(path, chunk):
+    buf = bytearray(chunk)
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        offset = 0
+        while True:
+            n = os.preadv(fd, [buf], offset)
+            if not n:
+                break
+            offset += n
+    finally:
+        os.close(fd)
+
+def _read_with_mmap(path, chunk):
+    import mmap
+    page = mmap.PAGESIZE
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        if hasattr(m, "madvise"):
+            m.madvise(mmap.MADV_SEQUENTIAL)
+        # Zero-copy: touch one byte per page so every page is mapped in
+        for offset in range(0, len(m), page):
+            m[offset]
+
+READ_PATHS = {
+    "read()": _read_with_read,
+    "readinto()": _read_with_readinto,
+    "os.preadv": _read_with_preadv,
+    "mmap + MADV_SEQUENTIAL": _read_with_mmap,
+}
+
+def read_path_benchmark(mountpoint=None, file_size=512 * 1024 ** 2, chunk=1024 ** 2,
+                        repetitions=3, cold=False):
+    """Compare read strategies on the same file: MB/s and CPU seconds per GB.
+
+    read() allocates a new bytes object per chunk; readinto() and os.preadv
+    reuse one preallocated buffer; mmap touches each page in place without
+    copying. By default every method reads a warm page cache, which isolates
+    the copy/allocation cost; cold=True evicts the file before each pass
+    where posix_fadvise is available.
+    """
+    path = None
+    try:
+        path = _prepare_test_file(benchmark_dir(mountpoint), file_size)
+        can_drop = hasattr(os, "posix_fadvise")
+        results = {
+            "File Size": format_size(file_size),
+            "Chunk Size": format_size(chunk),
+            "Page Cache": "Cold" if cold and can_drop else "Warm",
+        }
+
+        def drop_cache():
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                _drop_cached_pages(fd)
+            finally:
+                os.close(fd)
+
+        for name, read in READ_PATHS.items():
+            if name == "os.preadv" and not hasattr(os, "preadv"):
+                results[name] = "Unavailable on this OS"
+                continue
+            if not cold:
+                read(path, chunk)  # Warm the page cache and the code path
+            best_wall = best_cpu = None
+            for _ in range(repetitions):
+                if cold and can_drop:
+                    drop_cache()
+                cpu_start = time.process_time()
+                start = time.perf_counter_ns()
+                read(path, chunk)
+                wall = corrected_ns(time.perf_counter_ns() - start) / 1e9
+                cpu = time.process_time() - cpu_start
+                best_wall = wall if best_wall is None else min(best_wall, wall)
+                best_cpu = cpu if best_cpu is None else min(best_cpu, cpu)
+            results[name] = {
+                "MB/s": round(file_size / best_wall / 1e6, 1),
+                "CPU (s/GB)": round(best_cpu / (file_size / 1e9), 3),
+            }
+        return {"Read Path Benchmark": results}
+    except Exception as e:
+        return {"Error": f"Failed read path benchmark: {str(e)}"}
+    finally:
+        if path is not None:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+def _filesystem_of(directory):
+    """Return the filesystem type of the partition holding directory"""
+    directory = os.path.realpath(directory)
+    best, fstype = "", "Unknown"
+    for p in psutil.disk_partitions(all=True):
+        mount = os.path.realpath(p.mountpoint)
+        if len(mount) > len(best) and os.path.commonpath([mount, directory]) == mount:
+            best, fstype = mount, p.fstype
+    return fstype
+
+UNTIMEABLE = "Too fast to time reliably"
+
+def _rate(count, elapsed_ns, iterations):
+    """count per second over a corrected perf_counter_ns span, or UNTIMEABLE if it was too short"""
+    try:
+        return round(count / (corrected_ns(elapsed_ns, iterations) / 1e9))
+    except ValueError:
+        return UNTIMEABLE
+
+def _ops_per_sec(op, items):
+    """Apply op to every item and return the rate, less the calibrated loop and timer overhead"""
+    check_cancelled()
+    start = time.perf_counter_ns()
+    for item in items:
+        op(item)
+    return _rate(len(items), time.perf_counter_ns() - start, len(items))
+
+def metadata_benchmark(mountpoint=None, files=20000, files_per_dir=100, file_size=512):
+    """Small-file metadata throughput: mkdir, create, stat, scandir, rename, unlink, rmdir.
+
+    Files are spread over a two-level tree (16 top-level directories) in a
+    fresh directory on mountpoint, which is removed afterwards. Nothing is
+    fsynced, so this measures the filesystem and its journal through the
+    page cache, as build tools and package managers see it.
+    """
+    import shutil
+    import tempfile
+    root = None
+    try:
+        directory = benchmark_dir(mountpoint)
+        root = tempfile.mkdtemp(prefix="hardwarehouse-meta-", dir=directory)
+        dir_count = max(1, -(-files // files_per_dir))
+        top = [os.path.join(root, f"t{i:02d}") for i in range(min(16, dir_count))]
+        dirs = [os.path.join(top[j % len(top)], f"d{j:05d}") for j in range(dir_count)]
+        paths = [os.path.join(dirs[i // files_per_dir], f"f{i:06d}.dat") for i in range(files)]
+        renamed = [path[:-4] + ".tmp" for path in paths]
+        payload = os.urandom(file_size)
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+        def create(path):
+            fd = os.open(path, flags, 0o644)
+            try:
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
+
+        def scan(path):
+            # d_type from the directory listing; no per-entry stat
+            with os.scandir(path) as it:
+                for entry in it:
+                    entry.is_file(follow_symlinks=False)
+
+        results = {
+            "Target": directory,
+            "File System": _filesystem_of(directory),
+            "Files": files,
+            "Directories": dir_count + len(top),
+            "File Size": format_size(file_size),
+        }
+        results["Mkdir (ops/s)"] = _ops_per_sec(os.mkdir, top + dirs)
+        results["Create (ops/s)"] = _ops_per_sec(create, paths)
+        results["Stat (ops/s)"] = _ops_per_sec(os.stat, paths)
+        check_cancelled()
+        start = time.perf_counter_ns()
+        for path in dirs:
+            scan(path)
+        results["Scandir (entries/s)"] = _rate(files, time.perf_counter_ns() - start, len(dirs))
+        results["Rename (ops/s)"] = _ops_per_sec(lambda pair: os.rename(*pair), list(zip(paths, renamed)))
+        results["Unlink (ops/s)"] = _ops_per_sec(os.unlink, renamed)
+        results["Rmdir (ops/s)"] = _ops_per_sec(os.rmdir, dirs + top)
+        return {"Filesystem Metadata Benchmark": results}
+    except Exception as e:
+        return {"Error": f"Failed metadata benchmark: {str(e)}"}
+    finally:
+        if root is not None:
+            shutil.rmtree(root, ignore_errors=True)
+
+def disk_benchmark(mountpoint=None):
+    """Quick storage run: sequential MB/s and random 4K IOPS with 1 s per test"""
+    return storage_benchmark(mountpoint, file_size=128 * 1024 ** 2, duration=1.0)
 
 # --------------------------
 # Export Functions
@@ -263,7 +1889,7 @@ def export_json(data, filename="hardware_report.json"):
         return str(e)
 
 def export_csv(data, filename="hardware_report.csv"):
-    """Export data dictionary to CSV file. Handles nested lists as multiple rows."""
+    """Export data dictionary to CSV file. Handles nested lists and dicts as multiple rows."""
     try:
         with open(filename, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
@@ -278,6 +1904,9 @@ def export_csv(data, filename="hardware_report.csv"):
                                 write_dict(item, prefix + "    ")
                             else:
                                 writer.writerow([f"  Item {i}: {item}"])
+                    elif isinstance(v, dict):
+                        writer.writerow([prefix + k])
+                        write_dict(v, prefix + "  ")
                     else:
                         writer.writerow([prefix + k, v])
 
@@ -286,6 +1915,252 @@ def export_csv(data, filename="hardware_report.csv"):
     except Exception as e:
         return str(e)
 
+# --------------------------
+# Benchmark History
+# --------------------------
+
+BENCHMARK_HISTORY_PATH = os.path.join(DATA_DIR, "benchmark_history.sqlite3")
+HISTORY_BASELINE_RUNS = 10  # most recent matching runs that form the baseline
+HISTORY_MIN_BASELINE = 3  # runs needed before anything is flagged
+REGRESSION_Z = 3.0  # standard deviations worse than the baseline mean
+REGRESSION_MIN_SPREAD = 0.01  # floor on the baseline stddev, as a fraction of its mean
+# Settings, per-window samples and run bookkeeping rather than results; not worth tracking.
+# Batch times follow from the calibrated batch size, so only kernel_report's Ops/s are compared
+HISTORY_SKIP_KEYS = {
+    "Batch Size (ops)", "Median Batch (ms)", "Min Batch (ms)", "Stddev (ms)", "Repetitions",
+    "MB/s Over Time", "Timer Calibration", "Benchmark Runs",
+}
+# Stored with every run but left out of the baseline key: changes to these
+# are what the history is meant to catch, so they must not reset the baseline
+FINGERPRINT_TRACKED_ONLY = ("BIOS Version",)
+# Metric names containing these are better when lower (latencies, spread, loss)
+LOWER_IS_BETTER_MARKERS = ("latency", "time", "stddev", "loss")
+# ...as are names whose unit is a time, alone or per something: (ms), (s/GB), (ns/access)
+LOWER_IS_BETTER_UNIT = r"\((ns|us|ms|s)(/[^)]*)?\)"
+# List items are keyed by the first of these they carry, e.g. "Scaling / Workers=4"
+HISTORY_LIST_KEYS = ("Workers", "Connections", "Threads", "Name")
+
+HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    suite TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    environment TEXT NOT NULL,
+    hardware_json TEXT NOT NULL,
+    environment_json TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (run_id, name)
+);
+CREATE INDEX IF NOT EXISTS runs_by_key ON runs (suite, fingerprint, environment, id);
+CREATE INDEX IF NOT EXISTS metrics_by_name ON metrics (name, run_id);
+"""
+
+def _short_hash(data):
+    """Stable 16-hex-digit hash of a JSON-serialisable dict"""
+    import hashlib
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()[:16]
+
+def hardware_fingerprint():
+    """Return the hardware details stored with every benchmark run"""
+    cpu = snapshot_cache.get(get_cpu_info)
+    board = snapshot_cache.get(get_motherboard_info)
+    bios = snapshot_cache.get(get_bios_info)
+    return {
+        "CPU": cpu.get("Name", "Unknown"),
+        "Board": f"{board.get('Manufacturer', 'Unknown')} {board.get('Product', 'Unknown')}",
+        "BIOS Version": bios.get("Version", "Unknown"),
+        "RAM Total (bytes)": psutil.virtual_memory().total,
+    }
+
+def fingerprint_key(hardware):
+    """Hash of the hardware identity runs are compared within (firmware excluded)"""
+    return _short_hash({k: v for k, v in hardware.items() if k not in FINGERPRINT_TRACKED_ONLY})
+
+def _power_plan_name():
+    """Active power plan on Windows, cpufreq governor elsewhere"""
+    if platform.system() == "Windows":
+        return get_power_plan().get("Power Plan", "Unknown")
+    try:
+        with open("/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor") as f:
+            return f.read().strip()
+    except OSError:
+        return "Unknown"
+
+def benchmark_environment():
+    """Return the software settings that change results without changing hardware"""
+    return {
+        "Python": platform.python_version(),
+        "Implementation": platform.python_implementation(),
+        "Power Plan": _power_plan_name(),
+    }
+
+def flatten_metrics(results, prefix=""):
+    """Yield ("Section / Key", value) for every numeric leaf of a benchmark result dict"""
+    for key, value in results.items():
+        if key in HISTORY_SKIP_KEYS or key == "Error":
+            continue
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from flatten_metrics(value, name + " / ")
+        elif isinstance(value, list):
+            for i, item in enumerate(value, 1):
+                if not isinstance(item, dict):
+                    continue
+                label = next((k for k in HISTORY_LIST_KEYS if k in item), None)
+                if label is None:
+                    yield from flatten_metrics(item, f"{name} / Item {i} / ")
+                else:
+                    rest = {k: v for k, v in item.items() if k != label}
+                    yield from flatten_metrics(rest, f"{name} / {label}={item[label]} / ")
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield name, float(value)
+
+def lower_is_better(metric):
+    """Infer a metric's direction from its name"""
+    import re
+    name = metric.lower()
+    return (re.search(LOWER_IS_BETTER_UNIT, name) is not None
+            or any(marker in name for marker in LOWER_IS_BETTER_MARKERS))
+
+class BenchmarkHistory:
+    """SQLite store of benchmark runs, compared against earlier runs on the same machine.
+
+    A run's baseline is the most recent HISTORY_BASELINE_RUNS runs of the same
+    suite with the same hardware key and environment. The BIOS version is
+    stored but not part of the key, so a BIOS or driver update is compared
+    against the runs before it (and reported as a change), while a Python
+    upgrade starts a fresh baseline. Each call opens its own connection, so
+    any thread may use it.
+    """
+
+    def __init__(self, path=BENCHMARK_HISTORY_PATH):
+        self.path = path
+
+    def _connect(self):
+        import sqlite3
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.executescript(HISTORY_SCHEMA)
+        return conn
+
+    def record(self, suite, results, hardware=None, environment=None):
+        """Store one run's numeric metrics and return its run id"""
+        from contextlib import closing
+        hardware = hardware if hardware is not None else hardware_fingerprint()
+        environment = environment if environment is not None else benchmark_environment()
+        with closing(self._connect()) as conn, conn:
+            cursor = conn.execute(
+                "INSERT INTO runs (started_at, suite, fingerprint, environment, hardware_json, environment_json)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (datetime.now().isoformat(timespec="seconds"), suite, fingerprint_key(hardware),
+                 _short_hash(environment), json.dumps(hardware), json.dumps(environment)))
+            run_id = cursor.lastrowid
+            conn.executemany("INSERT OR REPLACE INTO metrics (run_id, name, value) VALUES (?, ?, ?)",
+                             [(run_id, name, value) for name, value in flatten_metrics(results)])
+        return run_id
+
+    def compare(self, run_id, baseline_runs=HISTORY_BASELINE_RUNS, z_threshold=REGRESSION_Z):
+        """Compare a run's metrics with its baseline.
+
+        Returns (baseline size, regressions, changes), where changes maps each
+        FINGERPRINT_TRACKED_ONLY field that differs from the latest baseline
+        run to "old -> new".
+        """
+        import statistics
+        from contextlib import closing
+        with closing(self._connect()) as conn:
+            suite, fingerprint, environment, hardware_json = conn.execute(
+                "SELECT suite, fingerprint, environment, hardware_json FROM runs WHERE id = ?",
+                (run_id,)).fetchone()
+            baseline = conn.execute(
+                "SELECT id, hardware_json FROM runs WHERE suite = ? AND fingerprint = ? AND environment = ?"
+                " AND id < ? ORDER BY id DESC LIMIT ?",
+                (suite, fingerprint, environment, run_id, baseline_runs)).fetchall()
+            baseline_ids = [row[0] for row in baseline]
+            current = dict(conn.execute("SELECT name, value FROM metrics WHERE run_id = ?", (run_id,)))
+            history = {}
+            if baseline_ids:
+                marks = ",".join("?" * len(baseline_ids))
+                for name, value in conn.execute(
+                        f"SELECT name, value FROM metrics WHERE run_id IN ({marks})", baseline_ids):
+                    history.setdefault(name, []).append(value)
+
+        changes = {}
+        if baseline:
+            current_hw, previous_hw = json.loads(hardware_json), json.loads(baseline[0][1])
+            for field in FINGERPRINT_TRACKED_ONLY:
+                if current_hw.get(field) != previous_hw.get(field):
+                    changes[field] = f"{previous_hw.get(field)} -> {current_hw.get(field)}"
+
+        regressions = {}
+        for name, value in current.items():
+            past = history.get(name, [])
+            if len(past) < HISTORY_MIN_BASELINE:
+                continue
+            mean = statistics.mean(past)
+            spread = max(statistics.stdev(past), abs(mean) * REGRESSION_MIN_SPREAD, 1e-12)
+            z = (value - mean) / spread
+            if lower_is_better(name):
+                z = -z
+            if z < -z_threshold:
+                regressions[name] = {
+                    "Value": value,
+                    "Baseline Mean": round(mean, 3),
+                    "Change (%)": round((value - mean) / mean * 100, 1) if mean else None,
+                    "z-score": round(z, 1),
+                }
+        return len(baseline_ids), regressions, changes
+
+    def runs(self, suite=None, limit=20):
+        """Return the most recent runs, newest first"""
+        from contextlib import closing
+        query = "SELECT id, started_at, suite, fingerprint, environment FROM runs"
+        params = []
+        if suite is not None:
+            query += " WHERE suite = ?"
+            params.append(suite)
+        query += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+        with closing(self._connect()) as conn:
+            return [
+                {"Run ID": run_id, "Started At": started, "Suite": suite_name,
+                 "Fingerprint": fp, "Environment": env}
+                for run_id, started, suite_name, fp, env in conn.execute(query, params)
+            ]
+
+benchmark_history = BenchmarkHistory()
+
+def record_benchmark_run(suite, results, history=None):
+    """Store results in the history and return a summary with any flagged regressions"""
+    history = history or benchmark_history
+    try:
+        hardware = hardware_fingerprint()
+        environment = benchmark_environment()
+        run_id = history.record(suite, results, hardware, environment)
+        baseline, regressions, changes = history.compare(run_id)
+        summary = {
+            "Run ID": run_id,
+            "Fingerprint": fingerprint_key(hardware),
+            "Environment": environment,
+            "Baseline Runs": baseline,
+            "Regressions": regressions or (
+                "None" if baseline >= HISTORY_MIN_BASELINE
+                else f"Baseline needs {HISTORY_MIN_BASELINE} runs"),
+        }
+        if changes:
+            summary["Changed Since Last Run"] = changes
+        return {"Benchmark History": summary}
+    except Exception as e:
+        return {"Error": f"Failed to record benchmark history: {str(e)}"}
+
 # --------------------------
 # GUI Application Class
 # --------------------------
@@ -309,7 +2184,7 @@ class HardwareHouseApp(ctk.CTk):
             "Motherboard Info",
             "Sound Devices",
             "Battery Info",
-            "Process Count",
+            "Process Table",
             "Boot Time",
             "Benchmarks",
         ]
@@ -333,6 +2208,21 @@ class HardwareHouseApp(ctk.CTk):
         self.export_csv_btn = ctk.CTkButton(btn_frame, text="Export CSV", command=self.export_csv)
         self.export_csv_btn.grid(row=0, column=2, padx=10)
 
+        # Refresh Button (drops cached collector results)
+        self.refresh_btn = ctk.CTkButton(btn_frame, text="Refresh", command=self.refresh_info)
+        self.refresh_btn.grid(row=0, column=3, padx=10)
+
+        # Cancel Button (stops a running benchmark)
+        self.cancel_btn = ctk.CTkButton(btn_frame, text="Cancel", command=self.cancel_benchmarks,
+                                        state="disabled")
+        self.cancel_btn.grid(row=0, column=4, padx=10)
+
+        # Where disk benchmarks put their test files
+        ctk.CTkLabel(btn_frame, text="Benchmark target:").grid(row=1, column=0, padx=10, pady=(5, 0))
+        self.target_menu = ctk.CTkOptionMenu(btn_frame, values=[BENCHMARK_DEFAULT_TARGET])
+        self.target_menu.grid(row=1, column=1, columnspan=2, padx=10, pady=(5, 0), sticky="ew")
+        self.update_benchmark_targets()
+
         # Textbox to display info
         self.textbox = ctk.CTkTextbox(self, width=860, height=530, font=("Segoe UI", 14))
         self.textbox.pack(pady=10)
@@ -343,6 +2233,7 @@ class HardwareHouseApp(ctk.CTk):
 
         # Storage for current info
         self.current_info = {}
+        self.benchmark_token = None
 
     def show_info(self):
         """Retrieve and show selected category info"""
@@ -353,41 +2244,29 @@ class HardwareHouseApp(ctk.CTk):
         if cat == "System Info":
             info = get_system_info()
         elif cat == "CPU Info":
-            info = get_cpu_info()
+            info = snapshot_cache.get(get_cpu_info)
         elif cat == "GPU Info":
-            info = {"GPUs": get_gpu_info()}
+            info = {"GPUs": snapshot_cache.get(get_gpu_info)}
         elif cat == "RAM Info":
-            info = get_ram_info()
+            info = snapshot_cache.get(get_ram_info)
         elif cat == "Disk Info":
-            info = {"Disks": get_disk_info()}
+            info = {"Disks": snapshot_cache.get(get_disk_info)}
         elif cat == "Network Info":
             info = {"Network Adapters": get_network_info()}
         elif cat == "BIOS Info":
-            info = get_bios_info()
+            info = snapshot_cache.get(get_bios_info)
         elif cat == "Motherboard Info":
-            info = get_motherboard_info()
+            info = snapshot_cache.get(get_motherboard_info)
         elif cat == "Sound Devices":
-            info = {"Sound Devices": get_sound_devices()}
+            info = {"Sound Devices": snapshot_cache.get(get_sound_devices)}
         elif cat == "Battery Info":
             info = get_battery_info()
-        elif cat == "Process Count":
-            info = get_process_count()
+        elif cat == "Process Table":
+            info = get_process_table()
         elif cat == "Boot Time":
             info = get_boot_time()
         elif cat == "Benchmarks":
-            self.textbox.insert("end", "Running CPU benchmark...\n")
-            info = {}
-            # Run benchmarks in thread to keep UI responsive
-            def run_benchmarks():
-                results = {}
-                results.update(cpu_benchmark())
-                results.update(memory_benchmark())
-                results.update(disk_benchmark())
-                self.current_info = results
-                # Update UI in main thread
-                self.textbox.after(0, lambda: self.display_info(results))
-
-            threading.Thread(target=run_benchmarks).start()
+            self.start_benchmarks("Benchmarks")
             return
         else:
             info = {"Error": "Unknown category"}
@@ -395,27 +2274,121 @@ class HardwareHouseApp(ctk.CTk):
         self.current_info = info
         self.display_info(info)
 
+    def update_benchmark_targets(self, poll_ms=100):
+        """Offer the writable mountpoints from get_disk_info as benchmark targets.
+
+        The disks are read on a worker thread, since a dead mount can take
+        DISK_USAGE_TIMEOUT to answer; the menu is updated on the Tk main thread.
+        """
+        request = self._targets_request = object()
+        results = queue.Queue()
+
+        def run():
+            results.put(benchmark_targets())
+
+        def poll():
+            if request is not self._targets_request:
+                return  # A newer refresh superseded this one
+            try:
+                targets = results.get_nowait()
+            except queue.Empty:
+                self.after(poll_ms, poll)
+                return
+            current = self.target_menu.get()
+            values = [BENCHMARK_DEFAULT_TARGET] + targets
+            self.target_menu.configure(values=values)
+            self.target_menu.set(current if current in values else BENCHMARK_DEFAULT_TARGET)
+
+        threading.Thread(target=run, daemon=True).start()
+        self.after(poll_ms, poll)
+
+    def start_benchmarks(self, suite, poll_ms=100):
+        """Run a benchmark suite in a worker thread and stream its progress into the textbox"""
+        if self.benchmark_token is not None:
+            self.textbox.insert("end", "A benchmark run is already in progress; cancel it first.\n")
+            return
+        token = self.benchmark_token = CancellationToken()
+        events = queue.Queue()
+        self.cancel_btn.configure(state="normal")
+        target = self.target_menu.get()
+        mountpoint = None if target == BENCHMARK_DEFAULT_TARGET else target
+        self.textbox.insert("end", f"Starting {suite} on {target}...\n")
+
+        def run():
+            results = {}
+            try:
+                # The fingerprint and CPU benchmarks may open a WMI connection on this thread
+                with wmi_provider.thread_scope():
+                    results = run_benchmark_suite(suite, token=token, progress=events.put, mountpoint=mountpoint)
+                    # Partial runs would skew the baseline
+                    if not token.cancelled:
+                        results.update(record_benchmark_run(suite, results))
+            except Exception as e:
+                results["Error"] = f"Benchmark run failed: {str(e)}"
+            finally:
+                # poll() only re-enables new runs once it sees this event
+                events.put({"phase": "Finished", "results": results})
+
+        def poll():
+            # Only the Tk main thread touches widgets and current_info
+            event = None
+            try:
+                while True:
+                    event = events.get_nowait()
+                    if "results" in event:
+                        self.benchmark_token = None
+                        self.cancel_btn.configure(state="disabled")
+                        if self.combo.get() == suite:
+                            self.set_info(event["results"])
+                        return
+            except queue.Empty:
+                pass
+            if event is not None and self.combo.get() == suite:
+                self.display_info({f"{suite} ({event['percent']}%)": event["phase"], **event["partial"]})
+            self.after(poll_ms, poll)
+
+        threading.Thread(target=run, daemon=True).start()
+        self.after(poll_ms, poll)
+
+    def cancel_benchmarks(self):
+        """Ask the running benchmark suite to stop"""
+        if self.benchmark_token is not None:
+            self.benchmark_token.cancel()
+            self.textbox.insert("end", "\nCancelling...\n")
+
+    def refresh_info(self):
+        """Invalidate cached collector results and show the category again"""
+        snapshot_cache.invalidate()
+        clear_wql_cache()
+        self.update_benchmark_targets()
+        self.show_info()
+
     def display_info(self, info):
         """Display info dict in the textbox"""
         self.textbox.delete("0.0", "end")
+        self.insert_info(info)
 
-        def recursive_display(data, indent=0):
-            indent_str = " " * (indent * 4)
-            if isinstance(data, dict):
-                for k, v in data.items():
-                    if isinstance(v, (dict, list)):
-                        self.textbox.insert("end", f"{indent_str}{k}:\n")
-                        recursive_display(v, indent + 1)
-                    else:
-                        self.textbox.insert("end", f"{indent_str}{k}: {v}\n")
-            elif isinstance(data, list):
-                for i, item in enumerate(data, 1):
-                    self.textbox.insert("end", f"{indent_str}- Item {i}:\n")
-                    recursive_display(item, indent + 1)
-            else:
-                self.textbox.insert("end", f"{indent_str}{data}\n")
+    def insert_info(self, data, indent=0, start=1):
+        """Append data to the textbox; list items are numbered from start"""
+        indent_str = " " * (indent * 4)
+        if isinstance(data, dict):
+            for k, v in data.items():
+                if isinstance(v, (dict, list)):
+                    self.textbox.insert("end", f"{indent_str}{k}:\n")
+                    self.insert_info(v, indent + 1)
+                else:
+                    self.textbox.insert("end", f"{indent_str}{k}: {v}\n")
+        elif isinstance(data, list):
+            for i, item in enumerate(data, start):
+                self.textbox.insert("end", f"{indent_str}- Item {i}:\n")
+                self.insert_info(item, indent + 1)
+        else:
+            self.textbox.insert("end", f"{indent_str}{data}\n")
 
-        recursive_display(info)
+    def set_info(self, info):
+        """Store and display info; call on the Tk main thread"""
+        self.current_info = info
+        self.display_info(info)
 
     def export_json(self):
         """Export current info to JSON file"""
@@ -439,18 +2412,271 @@ class HardwareHouseApp(ctk.CTk):
         else:
             self.textbox.insert("end", "\nNo data to export!\n")
 # --------------------------
+# Installed Software Inventory
+# --------------------------
+
+SOFTWARE_INDEX_PATH = os.path.join(DATA_DIR, "software_index.json")
+
+# Uninstall keys read on Windows: 64-bit, 32-bit and per-user installs
+UNINSTALL_KEYS = [
+    ("HKEY_LOCAL_MACHINE", r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
+    ("HKEY_LOCAL_MACHINE", r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"),
+    ("HKEY_CURRENT_USER", r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
+]
+
+# RPM header tags and value types used by the rpmdb.sqlite reader
+RPM_TAG_NAME, RPM_TAG_VERSION, RPM_TAG_RELEASE = 1000, 1001, 1002
+RPM_TAG_INSTALLTIME, RPM_TAG_VENDOR = 1008, 1011
+RPM_TYPE_INT32, RPM_TYPE_STRING, RPM_TYPE_STRING_ARRAY, RPM_TYPE_I18NSTRING = 4, 6, 8, 9
+
+def _registry_stamp(hive, path):
+    """Return the newest last-write time among an Uninstall key's subkeys"""
+    import winreg
+    with winreg.OpenKey(getattr(winreg, hive), path) as key:
+        subkeys, _, newest = winreg.QueryInfoKey(key)
+        for i in range(subkeys):
+            try:
+                with winreg.OpenKey(key, winreg.EnumKey(key, i)) as sub:
+                    newest = max(newest, winreg.QueryInfoKey(sub)[2])
+            except OSError:
+                continue
+    return [subkeys, newest]
+
+def _iter_registry_software(hive, path):
+    """Yield programs listed under one Uninstall key, as Programs and Features shows them"""
+    import winreg
+
+    def value(key, name):
+        try:
+            return winreg.QueryValueEx(key, name)[0]
+        except OSError:
+            return None
+
+    with winreg.OpenKey(getattr(winreg, hive), path) as key:
+        for i in range(winreg.QueryInfoKey(key)[0]):
+            try:
+                sub = winreg.OpenKey(key, winreg.EnumKey(key, i))
+            except OSError:
+                continue
+            with sub:
+                name = value(sub, "DisplayName")
+                # Hidden components and patches aren't separate programs
+                if not name or value(sub, "SystemComponent") == 1 or value(sub, "ParentKeyName"):
+                    continue
+                yield {
+                    "Name": name,
+                    "Version": value(sub, "DisplayVersion"),
+                    "Vendor": value(sub, "Publisher"),
+                    "Install Date": value(sub, "InstallDate"),
+                }
+
+def _iter_dpkg_software(status_path, info_dir):
+    """Yield installed packages from a dpkg status file, one paragraph at a time"""
+
+    def record(fields):
+        if not fields.get("Status", "").endswith(" installed"):
+            return None
+        package = fields.get("Package")
+        install_date = None
+        # dpkg keeps no install date; the package's file list is written at install
+        for list_name in (package, f"{package}:{fields.get('Architecture')}"):
+            try:
+                mtime = os.stat(os.path.join(info_dir, f"{list_name}.list")).st_mtime
+            except OSError:
+                continue
+            install_date = datetime.fromtimestamp(mtime).strftime("%Y%m%d")
+            break
+        return {
+            "Name": package,
+            "Version": fields.get("Version"),
+            "Vendor": fields.get("Origin") or fields.get("Maintainer"),
+            "Install Date": install_date,
+        }
+
+    fields = {}
+    with open(status_path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if line == "\n":
+                item = record(fields) if fields else None
+                if item:
+                    yield item
+                fields = {}
+            elif not line[0].isspace():
+                key, sep, val = line.partition(":")
+                if sep and key in ("Package", "Status", "Version", "Maintainer", "Origin", "Architecture"):
+                    fields[key] = val.strip()
+    item = record(fields) if fields else None
+    if item:
+        yield item
+
+def _parse_rpm_header(blob):
+    """Return {tag: value} for the tags we list from an RPM header blob"""
+    import struct
+    wanted = (RPM_TAG_NAME, RPM_TAG_VERSION, RPM_TAG_RELEASE, RPM_TAG_INSTALLTIME, RPM_TAG_VENDOR)
+    count, _ = struct.unpack_from(">II", blob, 0)
+    data_start = 8 + count * 16
+    tags = {}
+    for i in range(count):
+        tag, kind, offset, _ = struct.unpack_from(">IIiI", blob, 8 + i * 16)
+        if tag not in wanted:
+            continue
+        pos = data_start + offset
+        if kind in (RPM_TYPE_STRING, RPM_TYPE_STRING_ARRAY, RPM_TYPE_I18NSTRING):
+            tags[tag] = blob[pos:blob.index(b"\0", pos)].decode("utf-8", "replace")
+        elif kind == RPM_TYPE_INT32:
+            tags[tag] = struct.unpack_from(">i", blob, pos)[0]
+    return tags
+
+def _iter_rpm_software(db_path):
+    """Yield installed packages straight from an rpmdb.sqlite database"""
+    import sqlite3
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        for (blob,) in conn.execute("SELECT blob FROM Packages"):
+            tags = _parse_rpm_header(bytes(blob))
+            name = tags.get(RPM_TAG_NAME)
+            if not name or name == "gpg-pubkey":
+                continue
+            installed = tags.get(RPM_TAG_INSTALLTIME)
+            yield {
+                "Name": name,
+                "Version": "-".join(v for v in (tags.get(RPM_TAG_VERSION), tags.get(RPM_TAG_RELEASE)) if v),
+                "Vendor": tags.get(RPM_TAG_VENDOR),
+                "Install Date": datetime.fromtimestamp(installed).strftime("%Y%m%d") if installed else None,
+            }
+    finally:
+        conn.close()
+
+RPM_QUERY_FORMAT = "%{NAME}\\t%{VERSION}-%{RELEASE}\\t%{VENDOR}\\t%{INSTALLTIME}\\n"
+
+def _iter_rpm_query(db_path, root="/"):
+    """Yield installed packages via `rpm -qa` for Berkeley DB rpmdbs (e.g. RHEL/Alma 8)"""
+    import shutil
+    import subprocess
+    rpm = shutil.which("rpm")
+    if rpm is None:
+        yield {"Error": f"Unsupported package database {db_path}: Berkeley DB rpmdb and no rpm command"}
+        return
+    try:
+        output = subprocess.run(
+            [rpm, "-qa", "--root", root, "--queryformat", RPM_QUERY_FORMAT],
+            capture_output=True, text=True, timeout=120, check=True).stdout
+    except (OSError, subprocess.SubprocessError) as e:
+        yield {"Error": f"Failed to query {db_path} with rpm: {str(e)}"}
+        return
+    for line in output.splitlines():
+        fields = line.split("\t")
+        if len(fields) != 4 or fields[0] == "gpg-pubkey":
+            continue
+        name, version, vendor, installed = fields
+        yield {
+            "Name": name,
+            "Version": version,
+            "Vendor": None if vendor == "(none)" else vendor,
+            "Install Date": datetime.fromtimestamp(int(installed)).strftime("%Y%m%d")
+                            if installed.isdigit() else None,
+        }
+
+def _software_sources(root="/"):
+    """Return (source id, stamp function, record generator) for each package database"""
+    sources = []
+    if platform.system() == "Windows":
+        for hive, path in UNINSTALL_KEYS:
+            sources.append((
+                f"{hive}\\{path}",
+                lambda hive=hive, path=path: _registry_stamp(hive, path),
+                lambda hive=hive, path=path: _iter_registry_software(hive, path),
+            ))
+        return sources
+
+    dpkg_status = os.path.join(root, "var", "lib", "dpkg", "status")
+    dpkg_info = os.path.join(root, "var", "lib", "dpkg", "info")
+    if os.path.exists(dpkg_status):
+        sources.append((
+            dpkg_status,
+            lambda: os.stat(dpkg_status).st_mtime_ns,
+            lambda: _iter_dpkg_software(dpkg_status, dpkg_info),
+        ))
+    rpm_db = os.path.join(root, "var", "lib", "rpm", "rpmdb.sqlite")
+    if os.path.exists(rpm_db):
+        sources.append((
+            rpm_db,
+            lambda: os.stat(rpm_db).st_mtime_ns,
+            lambda: _iter_rpm_software(rpm_db),
+        ))
+    else:
+        bdb = os.path.join(root, "var", "lib", "rpm", "Packages")
+        if os.path.exists(bdb):
+            # Berkeley DB isn't readable from the stdlib; ask rpm itself
+            sources.append((
+                bdb,
+                lambda: os.stat(bdb).st_mtime_ns,
+                lambda: _iter_rpm_query(bdb, root),
+            ))
+    return sources
+
+def _load_software_index(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            index = json.load(f)
+        if isinstance(index.get("sources"), dict):
+            return index
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {"sources": {}}
+
+def _save_software_index(path, index):
+    """Write the index atomically so a crash never leaves half a file"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f)
+    os.replace(tmp_path, path)
+
+def iter_installed_software(index_path=SOFTWARE_INDEX_PATH, root="/"):
+    """Yield installed software records as soon as they are read.
+
+    Each package database is only parsed again when its mtime (or registry
+    last-write time) differs from the one stored in the persistent index;
+    otherwise its records come straight from the index. The index is only
+    written once the generator has been consumed to the end.
+    """
+    index = _load_software_index(index_path) if index_path else {"sources": {}}
+    fresh = {}
+    changed = False
+    for source_id, stamp, parse in _software_sources(root):
+        try:
+            current = stamp()
+        except OSError:
+            continue
+        entry = index["sources"].get(source_id)
+        if entry is not None and entry.get("stamp") == current:
+            fresh[source_id] = entry
+            yield from entry["records"]
+            continue
+        records = []
+        for record in parse():
+            records.append(record)
+            yield record
+        if not _has_error(records):  # Retry failed sources next time
+            fresh[source_id] = {"stamp": current, "records": records}
+            changed = True
+
+    if index_path and (changed or fresh.keys() != index["sources"].keys()):
+        try:
+            _save_software_index(index_path, {"sources": fresh})
+        except OSError:
+            pass  # The index is only an accelerator
+
+# --------------------------
 # Extended Hardware Info
 # --------------------------
 
 def get_usb_devices():
-    """Return list of connected USB devices"""
+    """Return connected USB devices as a controller -> hub -> device tree"""
     devices = []
     try:
-        for usb in c.Win32_USBControllerDevice():
-            dependent = usb.Dependent
-            if dependent:
-                dev = dependent.split('=')[1].strip('"')
-                devices.append(dev)
+        devices = get_hardware_provider().usb_devices()
     except Exception as e:
         devices.append({"Error": f"Failed to get USB devices: {str(e)}"})
     return devices
@@ -459,12 +2685,13 @@ def get_display_monitors():
     """Return display monitor info"""
     monitors = []
     try:
-        for monitor in c.Win32_DesktopMonitor():
+        for monitor in wmi_query("Win32_DesktopMonitor",
+                                 ["Name", "ScreenHeight", "ScreenWidth", "Status"], cache=False):
             monitors.append({
-                "Name": monitor.Name,
-                "Screen Height": monitor.ScreenHeight,
-                "Screen Width": monitor.ScreenWidth,
-                "Status": monitor.Status
+                "Name": monitor["Name"],
+                "Screen Height": monitor["ScreenHeight"],
+                "Screen Width": monitor["ScreenWidth"],
+                "Status": monitor["Status"]
             })
     except Exception as e:
         monitors.append({"Error": f"Failed to get monitor info: {str(e)}"})
@@ -474,13 +2701,14 @@ def get_printers():
     """Return installed printers info"""
     printers = []
     try:
-        for printer in c.Win32_Printer():
+        for printer in wmi_query("Win32_Printer",
+                                 ["Name", "Status", "Default", "Network", "Shared"], cache=False):
             printers.append({
-                "Name": printer.Name,
-                "Status": printer.Status,
-                "Default": printer.Default,
-                "Network": printer.Network,
-                "Shared": printer.Shared
+                "Name": printer["Name"],
+                "Status": printer["Status"],
+                "Default": printer["Default"],
+                "Network": printer["Network"],
+                "Shared": printer["Shared"]
             })
     except Exception as e:
         printers.append({"Error": f"Failed to get printers info: {str(e)}"})
@@ -490,13 +2718,7 @@ def get_installed_software():
     """Return list of installed software"""
     software_list = []
     try:
-        for software in c.Win32_Product():
-            software_list.append({
-                "Name": software.Name,
-                "Version": software.Version,
-                "Vendor": software.Vendor,
-                "Install Date": software.InstallDate
-            })
+        software_list.extend(iter_installed_software())
     except Exception as e:
         software_list.append({"Error": f"Failed to get software list: {str(e)}"})
     return software_list
@@ -537,51 +2759,1335 @@ def get_system_uptime():
     except Exception as e:
         return {"Error": f"Failed to get uptime: {str(e)}"}
 
+# --------------------------
+# Network Throughput
+# --------------------------
+
+NETWORK_HISTORY_SIZE = 60  # samples kept per interface
+NETWORK_COUNTER_FIELDS = (
+    "bytes_sent", "bytes_recv", "packets_sent", "packets_recv",
+    "errin", "errout", "dropin", "dropout",
+)
+
+class NetworkSampler:
+    """Sample per-interface I/O counters into preallocated ring buffers.
+
+    Each sample() is one psutil.net_io_counters(pernic=True) call; rates over
+    any window up to the ring size come from the buffered samples without
+    touching the OS again.
+    """
+
+    def __init__(self, history=NETWORK_HISTORY_SIZE):
+        self.history = history
+        self._rings = {}
+        self._lock = threading.Lock()
+
+    def _ring(self, nic):
+        ring = self._rings.get(nic)
+        if ring is None:
+            ring = self._rings[nic] = {
+                "times": [0.0] * self.history,
+                "counters": [None] * self.history,
+                "next": 0,
+                "count": 0,
+            }
+        return ring
+
+    def sample(self):
+        """Record one sample for every interface"""
+        counters = psutil.net_io_counters(pernic=True)
+        now = time.monotonic()
+        with self._lock:
+            for nic in list(self._rings):
+                if nic not in counters:
+                    del self._rings[nic]  # Interface went away
+            for nic, c in counters.items():
+                ring = self._ring(nic)
+                i = ring["next"]
+                ring["times"][i] = now
+                ring["counters"][i] = c
+                ring["next"] = (i + 1) % self.history
+                ring["count"] = min(ring["count"] + 1, self.history)
+
+    def interfaces(self):
+        with self._lock:
+            return list(self._rings)
+
+    def rates(self, nic, window=5.0):
+        """Return per-second rates and error/drop counts over the last window seconds.
+
+        Returns None until the interface has two samples.
+        """
+        with self._lock:
+            ring = self._rings.get(nic)
+            if ring is None or ring["count"] < 2:
+                return None
+            newest = (ring["next"] - 1) % self.history
+            t_new = ring["times"][newest]
+            # Walk back to the oldest sample still inside the window
+            oldest = (newest - 1) % self.history
+            for back in range(2, ring["count"]):
+                candidate = (newest - back) % self.history
+                if t_new - ring["times"][candidate] > window:
+                    break
+                oldest = candidate
+            new, old = ring["counters"][newest], ring["counters"][oldest]
+            elapsed = t_new - ring["times"][oldest]
+        if elapsed <= 0:
+            return None
+        delta = {f: max(0, getattr(new, f) - getattr(old, f)) for f in NETWORK_COUNTER_FIELDS}
+        return {
+            "elapsed": elapsed,
+            "bytes_sent": delta["bytes_sent"] / elapsed,
+            "bytes_recv": delta["bytes_recv"] / elapsed,
+            "packets_sent": delta["packets_sent"] / elapsed,
+            "packets_recv": delta["packets_recv"] / elapsed,
+            "errin": delta["errin"],
+            "errout": delta["errout"],
+            "dropin": delta["dropin"],
+            "dropout": delta["dropout"],
+        }
+
+# Shared sampler used by the GUI
+network_sampler = NetworkSampler()
+
+def get_network_throughput(window=5.0, sampler=None):
+    """Take a sample and return per-interface throughput over the last window seconds"""
+    sampler = sampler or network_sampler
+    interfaces = []
+    try:
+        sampler.sample()
+        stats = psutil.net_if_stats()
+        for nic in sampler.interfaces():
+            st = stats.get(nic)
+            entry = {
+                "Interface": nic,
+                "Status": "Up" if st and st.isup else "Down",
+                "Link Speed (Mbps)": st.speed if st and st.speed else "Unknown",
+                "MTU": st.mtu if st else "Unknown",
+            }
+            rates = sampler.rates(nic, window)
+            if rates is None:
+                entry["Rates"] = "Waiting for a second sample"
+            else:
+                entry.update({
+                    "Received (KB/s)": round(rates["bytes_recv"] / 1024, 2),
+                    "Sent (KB/s)": round(rates["bytes_sent"] / 1024, 2),
+                    "Packets In (/s)": round(rates["packets_recv"], 1),
+                    "Packets Out (/s)": round(rates["packets_sent"], 1),
+                    "Errors In": rates["errin"],
+                    "Errors Out": rates["errout"],
+                    "Drops In": rates["dropin"],
+                    "Drops Out": rates["dropout"],
+                    "Window (s)": round(rates["elapsed"], 1),
+                })
+            interfaces.append(entry)
+    except Exception as e:
+        interfaces.append({"Error": f"Failed to get network throughput: {str(e)}"})
+    return interfaces
+
+# --------------------------
+# Process Table
+# --------------------------
+
+PROCESS_SORT_KEYS = {
+    "cpu": "CPU (%)",
+    "rss": "RSS (MB)",
+    "io": "I/O (KB/s)",
+}
+
+class ProcessTable:
+    """Process list that is updated in place between refreshes.
+
+    psutil.process_iter() hands back the same Process objects on every call,
+    so cpu_percent() and the I/O rate are real deltas since the last refresh.
+    Static details (name, user, start time) are only read when a process is
+    first seen, and entries are dropped once the process exits.
+    """
+
+    def __init__(self):
+        self._entries = {}  # pid -> entry
+        self._lock = threading.Lock()
+        self._last_refresh = None
+
+    def _new_entry(self, proc):
+        with proc.oneshot():
+            try:
+                username = proc.username()
+            except psutil.AccessDenied:
+                username = None
+            entry = {
+                "proc": proc,
+                "PID": proc.pid,
+                "Name": proc.name(),
+                "User": username,
+                "Started": datetime.fromtimestamp(proc.create_time()).strftime("%Y-%m-%d %H:%M:%S"),
+                "CPU (%)": 0.0,
+                "RSS (MB)": 0.0,
+                "I/O (KB/s)": None,
+                "_io_bytes": None,
+            }
+            proc.cpu_percent(None)  # Prime the CPU delta
+        return entry
+
+    def refresh(self):
+        """Update every entry; returns the number of live processes"""
+        now = time.monotonic()
+        elapsed = now - self._last_refresh if self._last_refresh else None
+        seen = set()
+        with self._lock:
+            for proc in psutil.process_iter():
+                pid = proc.pid
+                try:
+                    entry = self._entries.get(pid)
+                    if entry is None or entry["proc"] is not proc:
+                        # New process (or a reused PID)
+                        entry = self._entries[pid] = self._new_entry(proc)
+                    with proc.oneshot():
+                        entry["CPU (%)"] = proc.cpu_percent(None)
+                        entry["RSS (MB)"] = round(proc.memory_info().rss / (1024 ** 2), 1)
+                        try:
+                            io = proc.io_counters()
+                            io_bytes = io.read_bytes + io.write_bytes
+                        except (psutil.AccessDenied, AttributeError):
+                            io_bytes = None  # Not permitted, or not supported on this OS
+                    if io_bytes is not None and entry["_io_bytes"] is not None and elapsed:
+                        entry["I/O (KB/s)"] = round(max(0, io_bytes - entry["_io_bytes"]) / 1024 / elapsed, 1)
+                    entry["_io_bytes"] = io_bytes
+                except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                    self._entries.pop(pid, None)
+                    continue
+                except psutil.AccessDenied:
+                    pass  # Keep whatever we could read
+                seen.add(pid)
+            for pid in self._entries.keys() - seen:
+                del self._entries[pid]
+            self._last_refresh = now
+            return len(self._entries)
+
+    def top(self, n=10, key="cpu"):
+        """Return the n busiest processes by "cpu", "rss" or "io" as display dicts"""
+        field = PROCESS_SORT_KEYS[key]
+        with self._lock:
+            entries = sorted(
+                self._entries.values(),
+                key=lambda e: e[field] if e[field] is not None else -1,
+                reverse=True,
+            )[:n]
+            return [
+                {k: v for k, v in e.items() if k != "proc" and not k.startswith("_")}
+                for e in entries
+            ]
+
+# Shared table used by the GUI
+process_table = ProcessTable()
+
+def get_process_table(n=10, table=None):
+    """Refresh the process table and return the top n processes by CPU, RSS and I/O"""
+    table = table or process_table
+    try:
+        count = table.refresh()
+        return {
+            "Running Processes": count,
+            "Top by CPU": table.top(n, "cpu"),
+            "Top by Memory": table.top(n, "rss"),
+            "Top by I/O": table.top(n, "io"),
+        }
+    except Exception as e:
+        return {"Error": f"Failed to get process table: {str(e)}"}
+
+# --------------------------
+# Full Report Collection
+# --------------------------
+
+# Every collector that makes up a full report, keyed by its GUI category name
+REPORT_COLLECTORS = {
+    "System Info": get_system_info,
+    "CPU Info": get_cpu_info,
+    "GPU Info": get_gpu_info,
+    "RAM Info": get_ram_info,
+    "Disk Info": get_disk_info,
+    "Network Info": get_network_info,
+    "BIOS Info": get_bios_info,
+    "Motherboard Info": get_motherboard_info,
+    "Sound Devices": get_sound_devices,
+    "Battery Info": get_battery_info,
+    "Process Table": get_process_table,
+    "Boot Time": get_boot_time,
+    "USB Devices": get_usb_devices,
+    "Display Monitors": get_display_monitors,
+    "Printers": get_printers,
+    "Installed Software": get_installed_software,
+    "Power Plan": get_power_plan,
+    "Locale & Timezone": get_system_locale,
+    "System Uptime": get_system_uptime,
+}
+
+# Per-collector timeouts in seconds; collectors not listed use the default
+DEFAULT_COLLECTOR_TIMEOUT = 15
+COLLECTOR_TIMEOUTS = {
+    "Installed Software": 120,
+}
+MAX_REPORT_WORKERS = 8
+
+def collect_full_report(collectors=None, max_workers=MAX_REPORT_WORKERS, timeouts=None, cache=None):
+    """Run collectors concurrently and return {category: result} in collector order.
+
+    Each collector's timeout starts when a worker picks it up, so a hung call
+    only loses its own entry and the report takes about as long as the
+    slowest collector that finishes. Workers are daemon threads, so a call
+    that never returns doesn't keep the process alive at exit. Pass a
+    SnapshotCache to reuse cached results for static and volatile collectors.
+    """
+    if collectors is None:
+        collectors = REPORT_COLLECTORS
+    limits = dict(COLLECTOR_TIMEOUTS)
+    limits.update(timeouts or {})
+    jobs = queue.Queue()
+    for name, func in collectors.items():
+        jobs.put((name, func))
+    finished = queue.Queue()
+    done_event = threading.Event()
+    started = {}
+    report = {}
+
+    def worker():
+        while not done_event.is_set():
+            try:
+                name, func = jobs.get_nowait()
+            except queue.Empty:
+                return
+            started[name] = time.monotonic()
+            # Worker threads are short-lived, so give back any WMI/COM state they picked up
+            try:
+                with wmi_provider.thread_scope():
+                    result = cache.get(func) if cache is not None else func()
+            except Exception as e:
+                result = {"Error": f"Collector failed: {str(e)}"}
+            finished.put((name, result))
+
+    def start_worker():
+        threading.Thread(target=worker, name="collector", daemon=True).start()
+
+    for _ in range(max(1, min(max_workers, len(collectors)))):
+        start_worker()
+    pending = set(collectors)
+    try:
+        while pending:
+            # Sleep until the earliest running collector's deadline, or briefly
+            # if some collectors are still queued behind busy workers
+            now = time.monotonic()
+            deadlines = [
+                started[name] + limits.get(name, DEFAULT_COLLECTOR_TIMEOUT)
+                for name in pending if name in started
+            ]
+            wait_for = max(0.0, min(deadlines) - now) if deadlines else 0.05
+            if len(deadlines) < len(pending):
+                wait_for = min(wait_for, 0.05)
+            try:
+                name, result = finished.get(timeout=wait_for)
+                if name in pending:
+                    pending.discard(name)
+                    report[name] = result
+            except queue.Empty:
+                pass
+
+            now = time.monotonic()
+            for name in list(pending):
+                limit = limits.get(name, DEFAULT_COLLECTOR_TIMEOUT)
+                if name in started and now - started[name] >= limit:
+                    pending.discard(name)
+                    report[name] = {"Error": f"Timed out after {limit}s"}
+                    # Its worker may never come back; replace it so queued collectors still run
+                    start_worker()
+    finally:
+        # Queued collectors are dropped; ones that timed out finish on their own
+        done_event.set()
+
+    return {name: report[name] for name in collectors}
+
 # --------------------------
 # Extended Benchmarks
 # --------------------------
 
-def extended_cpu_benchmark(duration=5):
-    """Extended CPU benchmark: perform multiple math ops"""
+def extended_cpu_kernel(n):
+    """n rounds of 99 mixed sqrt/sin/log evaluations"""
     import math
-    end = time.time() + duration
-    count = 0
-    while time.time() < end:
+    for _ in range(n):
         for i in range(1, 100):
             _ = math.sqrt(i * i + 1) * math.sin(i) + math.log(i + 1)
-        count += 1
-    return {"Extended CPU Benchmark loops": count}
 
-def extended_memory_benchmark():
-    """Allocate large arrays and perform operations"""
+def extended_cpu_benchmark(duration=5, repetitions=5, warmup=1):
+    """Extended CPU benchmark: calibrated batches of mixed math ops"""
+    stats = benchmark_kernel(extended_cpu_kernel, warmup, repetitions, target=duration / (warmup + repetitions))
+    return {"Extended CPU Benchmark (99-op rounds)": kernel_report(stats)}
+
+_worker_barrier = None
+
+def _multicore_init(barrier):
+    """Process pool initializer: keep the shared start barrier"""
+    global _worker_barrier
+    _worker_barrier = barrier
+
+def _multicore_worker(kernel, batch, repetitions):
+    """Warm up, wait for every worker, then time repetitions of kernel(batch)"""
+    kernel(batch)
+    _worker_barrier.wait(timeout=120)
+    start = time.perf_counter_ns()
+    for _ in range(repetitions):
+        kernel(batch)
+    return batch * repetitions, start, time.perf_counter_ns()
+
+def _scaling_steps(max_workers):
+    """Return 1, 2, 4, ... up to max_workers, always ending with max_workers"""
+    steps = []
+    k = 1
+    while k < max_workers:
+        steps.append(k)
+        k *= 2
+    steps.append(max_workers)
+    return steps
+
+def multicore_cpu_benchmark(kernel=cpu_kernel, max_workers=None, repetitions=3, batch_time=0.2):
+    """Run kernel in 1, 2, 4 ... N processes at once and report throughput scaling.
+
+    Workers start together at a barrier, and throughput is total work over
+    the span from the first start to the last finish, so stragglers (SMT
+    siblings, throttled cores) show up as lost efficiency.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    try:
+        if max_workers is None:
+            logical = snapshot_cache.get(get_cpu_info).get("Threads (Logical)")
+            max_workers = logical if isinstance(logical, int) and logical > 0 else os.cpu_count() or 1
+        batch = calibrate_batch(kernel, batch_time)
+        # spawn everywhere: forking a process that runs Tk and worker threads is unsafe
+        ctx = multiprocessing.get_context("spawn")
+        steps = []
+        base = None
+        for workers in _scaling_steps(max_workers):
+            check_cancelled()
+            barrier = ctx.Barrier(workers)
+            with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                                     initializer=_multicore_init, initargs=(barrier,)) as pool:
+                futures = [pool.submit(_multicore_worker, kernel, batch, repetitions) for _ in range(workers)]
+                results = [f.result() for f in futures]
+            ops = sum(r[0] for r in results)
+            span = (max(r[2] for r in results) - min(r[1] for r in results)) / 1e9
+            throughput = ops / span
+            if base is None:
+                base = throughput
+            steps.append({
+                "Workers": workers,
+                "Ops/s": round(throughput),
+                "Speedup": round(throughput / base, 2),
+                "Parallel Efficiency (%)": round(100 * throughput / (workers * base), 1),
+            })
+        return {"Multi-Core CPU Benchmark": {
+            "Logical Processors": max_workers,
+            "Batch Size (ops)": batch,
+            "Scaling": steps,
+        }}
+    except Exception as e:
+        return {"Error": f"Failed multi-core CPU benchmark: {str(e)}"}
+
+# (codec, level) pairs; the first level of each codec also gets a decompression figure
+COMPRESSION_CODECS = [("zlib", 1), ("zlib", 6), ("zlib", 9), ("bz2", 1), ("bz2", 9), ("lzma", 0), ("lzma", 6)]
+HASH_ALGORITHMS = ["sha256", "blake2b"]
+
+def compression_corpus(size=2 * 1024 ** 2, seed=0):
+    """Deterministic log-like corpus: JSON lines over a Zipf vocabulary, with some random tokens.
+
+    It compresses roughly like real logs and telemetry (zlib -6 around 4-5x)
+    rather than like zeros or pure noise.
+    """
+    import base64
+    import random
+    rnd = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    vocabulary = ["".join(rnd.choices(letters, k=rnd.randint(2, 10))) for _ in range(2000)]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    levels = ["DEBUG", "INFO", "INFO", "INFO", "WARNING", "ERROR"]
+    lines = []
+    total = 0
+    ts = 1_700_000_000.0
+    while total < size:
+        ts += rnd.expovariate(50)
+        message = " ".join(rnd.choices(vocabulary, weights, k=rnd.randint(4, 16)))
+        line = (f'{{"ts": {ts:.3f}, "level": "{rnd.choice(levels)}", "host": "web-{rnd.randint(1, 24):02d}", '
+                f'"msg": "{message}", "latency_ms": {rnd.lognormvariate(2, 1):.2f}')
+        if rnd.random() < 0.05:
+            line += f', "token": "{base64.b64encode(rnd.randbytes(48)).decode()}"'
+        line += "}\n"
+        lines.append(line)
+        total += len(line)
+    return "".join(lines).encode()[:size]
+
+def _codec_functions(codec, level):
+    """Return (compress, decompress) callables for a stdlib codec at a level"""
+    import bz2
+    import lzma
+    import zlib
+    if codec == "zlib":
+        return (lambda data: zlib.compress(data, level)), zlib.decompress
+    if codec == "bz2":
+        return (lambda data: bz2.compress(data, level)), bz2.decompress
+    if codec == "lzma":
+        return (lambda data: lzma.compress(data, preset=level)), lzma.decompress
+    raise ValueError(f"Unknown codec {codec}")
+
+def compression_benchmark(corpus_size=2 * 1024 ** 2, workers=None, warmup=1, repetitions=3, target=0.2):
+    """zlib/bz2/lzma and sha256/blake2b throughput over an in-memory corpus.
+
+    Each operation runs on one thread and then on `workers` threads at once
+    (all of these release the GIL on large buffers), each thread doing the
+    same batch, so the two MB/s figures are directly comparable.
+    """
+    import hashlib
+    from concurrent.futures import ThreadPoolExecutor
+    try:
+        workers = workers or os.cpu_count() or 1
+        corpus = compression_corpus(corpus_size)
+        size = len(corpus)
+
+        def rates(func, data=corpus):
+            def single(n):
+                for _ in range(n):
+                    func(data)
+
+            def parallel(n):
+                list(pool.map(single, [n] * workers))
+
+            one = benchmark_kernel(single, warmup, repetitions, target=target)
+            many = benchmark_kernel(parallel, warmup, repetitions, batch=one["batch"])
+            return (round(one["ops_per_sec"] * len(data) / 1e6, 1),
+                    round(many["ops_per_sec"] * workers * len(data) / 1e6, 1))
+
+        results = {"Corpus": {"Size": format_size(size), "Threads": workers}}
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            seen = set()
+            for codec, level in COMPRESSION_CODECS:
+                compress, decompress = _codec_functions(codec, level)
+                compressed = compress(corpus)
+                single, parallel = rates(compress)
+                entry = {
+                    "Ratio": round(size / len(compressed), 2),
+                    "Compress MB/s (1 thread)": single,
+                    "Compress MB/s (all threads)": parallel,
+                }
+                if codec not in seen:
+                    seen.add(codec)
+                    # Rated by uncompressed bytes produced, as codec tools do
+                    single, parallel = rates(decompress, compressed)
+                    entry["Decompress MB/s (1 thread)"] = round(single * size / len(compressed), 1)
+                    entry["Decompress MB/s (all threads)"] = round(parallel * size / len(compressed), 1)
+                results[f"{codec} level {level}"] = entry
+            for algorithm in HASH_ALGORITHMS:
+                single, parallel = rates(lambda data: hashlib.new(algorithm, data).digest())
+                results[algorithm] = {"MB/s (1 thread)": single, "MB/s (all threads)": parallel}
+        return {"Compression & Hashing Benchmark": results}
+    except Exception as e:
+        return {"Error": f"Failed compression benchmark: {str(e)}"}
+
+CACHE_LINE = 64  # bytes
+
+def _pointer_chain(nbytes, seed=0):
+    """Return an int64 array forming one random cycle with one link per cache line"""
     import numpy as np
+    stride = CACHE_LINE // 8
+    lines = max(2, nbytes // CACHE_LINE)
+    order = np.random.default_rng(seed).permutation(lines) * stride
+    # Writing every link also faults in every page before timing
+    chain = np.zeros(lines * stride, dtype=np.int64)
+    chain[order[:-1]] = order[1:]
+    chain[order[-1]] = order[0]
+    return chain
+
+def _chase(chain, steps):
+    """Follow the chain steps times (unrolled x8); returns ns per access, less the loop's own cost"""
+    mv = memoryview(chain)
+    i = 0
+    rounds = steps // 8
+    start = time.perf_counter_ns()
+    for _ in range(rounds):
+        i = mv[i]; i = mv[i]; i = mv[i]; i = mv[i]
+        i = mv[i]; i = mv[i]; i = mv[i]; i = mv[i]
+    return corrected_ns(time.perf_counter_ns() - start, rounds) / (rounds * 8)
+
+LATENCY_KNEE_NS = 15.0  # rise in ns/access that counts as a knee; smaller steps drown in interpreter noise
+LATENCY_KNEE_SPAN = 2  # sizes on each side of a step that must all agree
+
+def _latency_knees(above_l1, threshold=LATENCY_KNEE_NS, span=LATENCY_KNEE_SPAN, limit=4):
+    """Return the working-set sizes just before the biggest sustained latency steps.
+
+    above_l1 maps sizes to ns/access over the smallest working set. A step
+    counts when the lowest of the next span sizes sits at least threshold ns
+    above the highest of the previous span, so a single noisy point doesn't
+    register as a knee; of two adjacent steps only the bigger is kept. The
+    smallest size is the L1 baseline itself and is never reported.
+    """
+    sizes = list(above_l1)
+    jumps = []
+    for i in range(1, len(sizes) - 1):
+        before = [above_l1[s] for s in sizes[max(0, i - span + 1):i + 1]]
+        after = [above_l1[s] for s in sizes[i + 1:i + 1 + span]]
+        rise = min(after) - max(before)
+        if rise >= threshold:
+            jumps.append((rise, i))
+    kept = set()
+    for rise, i in sorted(jumps, reverse=True):
+        if len(kept) < limit and i - 1 not in kept and i + 1 not in kept:
+            kept.add(i)
+    return [sizes[i] for i in sorted(kept)]
+
+def memory_latency_benchmark(min_size=4 * 1024, max_size=4 * 1024 ** 3, steps=1_000_000, repetitions=7):
+    """Pointer-chasing load latency from min_size to max_size working sets.
+
+    Each access depends on the previous one, so prefetchers can't hide the
+    latency. Each figure is the median of repetitions chases. Raw figures
+    include the interpreter's per-access cost; "Above L1" subtracts the
+    smallest working set's figure, and knees are detected on that curve and
+    compared with the L2/L3 sizes reported by get_cpu_info.
+    """
+    import statistics
+    try:
+        import numpy as np  # noqa: F401 (chains are NumPy arrays)
+        try:
+            max_size = min(max_size, psutil.virtual_memory().available // 3)
+        except Exception:
+            pass
+
+        curve = {}
+        size = min_size
+        while size <= max_size:
+            chain = _pointer_chain(size)
+            _chase(chain, min(steps, 100_000))  # Warm caches and TLB
+            curve[size] = statistics.median([_chase(chain, steps) for _ in range(repetitions)])
+            del chain
+            size *= 2
+
+        baseline = curve[min_size]
+        above_l1 = {s: ns - baseline for s, ns in curve.items()}
+        knees = _latency_knees(above_l1)
+
+        cpu = snapshot_cache.get(get_cpu_info)
+        reported = {}
+        l2, l3, cores = cpu.get("L2 Cache Size (KB)"), l3_instance_kb(cpu), cpu.get("Cores (Physical)")
+        if isinstance(l2, int) and l2 > 0:
+            reported["L2 (per core)"] = l2 * 1024 // (cores if isinstance(cores, int) and cores > 0 else 1)
+        if l3 is not None:
+            reported["L3 (per instance)"] = l3 * 1024
+        cross_check = {}
+        for level, cache_bytes in reported.items():
+            near = [k for k in knees if cache_bytes / 2 <= k <= cache_bytes * 2]
+            cross_check[f"{level} {format_size(cache_bytes)}"] = (
+                f"Knee at {format_size(near[0])}" if near else "No knee within 2x")
+
+        return {"Memory Latency": {
+            "Curve (ns/access)": {format_size(s): round(ns, 2) for s, ns in curve.items()},
+            "Above L1 (ns/access)": {format_size(s): round(ns, 2) for s, ns in above_l1.items()},
+            "Detected Knees": [format_size(k) for k in knees] or ["None"],
+            "Cache Cross-Check": cross_check or {"Info": "CPU info reports no cache sizes"},
+        }}
+    except Exception as e:
+        return {"Error": f"Failed memory latency benchmark: {str(e)}"}
+
+def _blas_info(np):
+    """Return the BLAS library NumPy was built against and its thread count"""
+    info = {"NumPy": np.__version__}
+    try:
+        blas = np.show_config(mode="dicts")["Build Dependencies"]["blas"]
+        info["BLAS"] = f"{blas.get('name', 'Unknown')} {blas.get('version', '')}".strip()
+    except Exception:  # NumPy < 1.25 only prints its config
+        info["BLAS"] = "Unknown"
+    try:
+        from threadpoolctl import threadpool_info
+        pools = [p for p in threadpool_info() if p.get("user_api") == "blas"]
+        info["BLAS Threads"] = pools[0]["num_threads"] if pools else "Unknown"
+    except ImportError:
+        env = [os.environ.get(v) for v in ("OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "OMP_NUM_THREADS")]
+        info["BLAS Threads"] = next((v for v in env if v), f"Default ({os.cpu_count()} CPUs)")
+    return info
+
+def numpy_compute_benchmark(matmul_size=1024, fft_size=2 ** 20, array_size=4 * 10 ** 6,
+                            warmup=1, repetitions=5, target=0.2):
+    """NumPy throughput: dense matmul, FFT, sort, a fused ufunc chain and RNG.
+
+    Each kernel runs through benchmark_kernel, so figures are medians over
+    calibrated, warmed-up batches. FFT GFLOPS use the usual 5 N log2 N
+    estimate. The BLAS backend and thread count are recorded because matmul
+    results mean little without them.
+    """
+    import math
     try:
-        arr = np.random.rand(10**7)  # 10 million floats
-        start = time.time()
-        s = np.sum(arr)
-        elapsed = time.time() - start
-        return {"Extended Memory Benchmark (sum 10M floats)": f"{elapsed:.4f} seconds"}
+        import numpy as np
+    except ImportError:
+        return {"Error": "NumPy compute benchmark requires NumPy"}
+    try:
+        rng = np.random.default_rng(0)
+        results = {"Build": _blas_info(np)}
+
+        def run(kernel):
+            return benchmark_kernel(kernel, warmup, repetitions, target=target)
+
+        # Each helper owns its arrays, so they are freed before the next kernel allocates
+        def matmul_figures(dtype):
+            a = rng.random((matmul_size, matmul_size)).astype(dtype)
+            b = rng.random((matmul_size, matmul_size)).astype(dtype)
+            out = np.empty_like(a)
+
+            def matmul(n):
+                for _ in range(n):
+                    np.matmul(a, b, out=out)
+
+            stats = run(matmul)
+            return {
+                "GFLOPS": round(stats["ops_per_sec"] * 2 * matmul_size ** 3 / 1e9, 1),
+                "Median (ms)": round(stats["median_ns"] / stats["batch"] / 1e6, 3),
+            }
+
+        def fft_figures():
+            signal = rng.standard_normal(fft_size) + 1j * rng.standard_normal(fft_size)
+
+            def fft(n):
+                for _ in range(n):
+                    np.fft.fft(signal)
+
+            stats = run(fft)
+            return {
+                "GFLOPS": round(stats["ops_per_sec"] * 5 * fft_size * math.log2(fft_size) / 1e9, 2),
+                "Median (ms)": round(stats["median_ns"] / stats["batch"] / 1e6, 3),
+            }
+
+        def sort_figures():
+            # np.sort returns a sorted copy, so every call sorts the same random input
+            values = rng.random(array_size)
+
+            def sort(n):
+                for _ in range(n):
+                    np.sort(values)
+
+            stats = run(sort)
+            return {
+                "M Elements/s": round(stats["ops_per_sec"] * array_size / 1e6, 1),
+                "Median (ms)": round(stats["median_ns"] / stats["batch"] / 1e6, 3),
+            }
+
+        def ufunc_figures():
+            # sqrt(x * y + z) * x with preallocated outputs: four passes, no temporaries
+            x, y, z = rng.random(array_size), rng.random(array_size), rng.random(array_size)
+            tmp = np.empty_like(x)
+
+            def ufunc_chain(n):
+                for _ in range(n):
+                    np.multiply(x, y, out=tmp)
+                    np.add(tmp, z, out=tmp)
+                    np.sqrt(tmp, out=tmp)
+                    np.multiply(tmp, x, out=tmp)
+
+            stats = run(ufunc_chain)
+            return {
+                "M Elements/s": round(stats["ops_per_sec"] * array_size / 1e6, 1),
+                "Median (ms)": round(stats["median_ns"] / stats["batch"] / 1e6, 3),
+            }
+
+        def rng_figures(method):
+            generator = np.random.default_rng()
+            out = np.empty(array_size)
+            fill = getattr(generator, method)
+
+            def draw(n):
+                for _ in range(n):
+                    fill(out=out)
+
+            stats = run(draw)
+            return {
+                "M Numbers/s": round(stats["ops_per_sec"] * array_size / 1e6, 1),
+                "Median (ms)": round(stats["median_ns"] / stats["batch"] / 1e6, 3),
+            }
+
+        for dtype in (np.float32, np.float64):
+            results[f"Matmul {matmul_size}x{matmul_size} ({np.dtype(dtype).name})"] = matmul_figures(dtype)
+        results[f"FFT {fft_size} points (complex128)"] = fft_figures()
+        results[f"Sort {array_size} float64"] = sort_figures()
+        results["Ufunc Chain sqrt(x*y+z)*x (float64)"] = ufunc_figures()
+        for label, method in (("Uniform", "random"), ("Normal", "standard_normal")):
+            results[f"RNG {label} (PCG64, float64)"] = rng_figures(method)
+        return {"NumPy Compute Benchmark": results}
     except Exception as e:
-        return {"Error": f"Failed extended memory benchmark: {str(e)}"}
+        return {"Error": f"Failed NumPy compute benchmark: {str(e)}"}
+
+def _write_timeline(chunk_ends, chunk_size, windows=60, min_width=0.25):
+    """Bucket per-chunk completion times (s) into at most `windows` MB/s samples"""
+    import math
+    total = chunk_ends[-1]
+    width = max(total / windows, min_width)
+    buckets = [0] * max(1, math.ceil(total / width))
+    for end in chunk_ends:
+        buckets[min(int(end / width), len(buckets) - 1)] += 1
+    # The last window is usually partial; rate it over the time it actually covered
+    last = total - width * (len(buckets) - 1)
+    rates = [count * chunk_size / width / 1e6 for count in buckets[:-1]]
+    rates.append(buckets[-1] * chunk_size / max(last, 1e-9) / 1e6)
+    return width, rates
 
-def extended_disk_benchmark():
-    """Perform multiple write/read cycles on disk"""
+def _find_cliff(rates, drop=0.5, sustain=3):
+    """Return the index of the first window where the rate stays below drop x the early rate"""
+    import statistics
+    if len(rates) < sustain + 1:
+        return None, rates[0]
+    head = rates[:max(1, len(rates) // 10)]
+    early = statistics.median(head)
+    below = 0
+    for i, rate in enumerate(rates):
+        below = below + 1 if rate < early * drop else 0
+        if below == sustain:
+            return i - sustain + 1, early
+    return None, early
+
+def extended_disk_benchmark(mountpoint=None, total_size=4 * 1024 ** 3, chunk_size=4 * 1024 ** 2, direct=False):
+    """Stream total_size bytes to disk in fixed chunks from one reused buffer.
+
+    Each chunk's write latency is recorded, and throughput is reported over
+    time, so the point where the OS write cache or an SSD's SLC cache runs out
+    shows up as a cliff instead of being averaged away. Pick a total_size
+    larger than RAM to get past the page cache; it is capped at half the free
+    space on the target.
+    """
+    import mmap
     import tempfile
-    import os
-    try:
-        filename = tempfile.mktemp()
-        data = b"x" * (5 * 10**7)  # 50 MB
-        start = time.time()
-        for _ in range(3):
-            with open(filename, "wb") as f:
-                f.write(data)
-            with open(filename, "rb") as f:
-                _ = f.read()
-        elapsed = time.time() - start
-        os.remove(filename)
-        return {"Extended Disk Benchmark (3x 50MB write/read)": f"{elapsed:.4f} seconds"}
+    path = None
+    fd = None
+    try:
+        directory = benchmark_dir(mountpoint)
+        free = psutil.disk_usage(directory).free
+        total_size = min(total_size, free // 2)
+        chunks = max(1, total_size // chunk_size)
+        buf = mmap.mmap(-1, chunk_size)  # Page-aligned so O_DIRECT works too
+        buf.write(os.urandom(chunk_size))  # Incompressible
+        view = memoryview(buf)
+
+        fd, path = tempfile.mkstemp(prefix="hardwarehouse-", suffix=".bench", dir=directory)
+        direct_on = False
+        if direct:
+            os.close(fd)
+            fd, direct_on = _open_test_file(path, True)
+
+        latencies = []
+        chunk_ends = []
+        start = time.perf_counter_ns()
+        for _ in range(chunks):
+            t0 = time.perf_counter_ns()
+            written = 0
+            while written < chunk_size:
+                written += os.write(fd, view[written:])
+            t1 = time.perf_counter_ns()
+            latencies.append(t1 - t0)
+            chunk_ends.append((t1 - start) / 1e9)
+        t0 = time.perf_counter_ns()
+        os.fsync(fd)
+        fsync_time = (time.perf_counter_ns() - t0) / 1e9
+        elapsed = (time.perf_counter_ns() - start) / 1e9
+        os.close(fd)
+        fd = None
+
+        # Read the file back through the same buffer
+        read_start = time.perf_counter()
+        with open(path, "rb", buffering=0) as f:
+            while f.readinto(view):
+                pass
+        read_time = time.perf_counter() - read_start
+        view.release()
+        buf.close()
+
+        written_bytes = chunks * chunk_size
+        width, rates = _write_timeline(chunk_ends, chunk_size)
+        cliff, early = _find_cliff(rates)
+        latencies.sort()
+        if cliff is not None:
+            # The rate isn't constant when there is a cliff, so count the chunks finished before it
+            before_cliff = sum(end <= cliff * width for end in chunk_ends) * chunk_size
+        results = {
+            "Target": directory,
+            "Total Written": format_size(written_bytes),
+            "Chunk Size": format_size(chunk_size),
+            "Direct I/O": "On" if direct_on else "Off",
+            "Write MB/s (incl. fsync)": round(written_bytes / elapsed / 1e6, 1),
+            "Final fsync (s)": round(fsync_time, 3),
+            "Read Back MB/s": round(written_bytes / read_time / 1e6, 1),
+            "Chunk Latency (ms)": {k: round(v / 1e6, 2) for k, v in _percentiles(latencies).items()},
+            "Early MB/s": round(early, 1),
+            "Write Cliff": (
+                f"After ~{format_size(before_cliff)} "
+                f"at {cliff * width:.1f}s (below {round(early * 0.5, 1)} MB/s)"
+                if cliff is not None else "None detected"),
+            "MB/s Over Time": {f"{i * width:.1f}s": round(rate, 1) for i, rate in enumerate(rates)},
+        }
+        return {"Extended Disk Benchmark (streaming write)": results}
     except Exception as e:
         return {"Error": f"Failed extended disk benchmark: {str(e)}"}
+    finally:
+        if fd is not None:
+            os.close(fd)
+        if path is not None:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+# --------------------------
+# Loopback Network Benchmark
+# --------------------------
+
+LOOPBACK_HOST = "127.0.0.1"
+TCP_BULK_CHUNK = 256 * 1024  # bytes per write in throughput tests
+RTT_WARMUP = 100  # round trips discarded per connection
+
+async def _tcp_server_handler(reader, writer):
+    """First byte picks the mode: b"S" sinks until EOF and replies with the byte count,
+    b"E" echoes length-prefixed messages"""
+    import asyncio
+    try:
+        mode = await reader.readexactly(1)
+        if mode == b"S":
+            total = 0
+            while True:
+                data = await reader.read(1024 ** 2)
+                if not data:
+                    break
+                total += len(data)
+            writer.write(total.to_bytes(8, "big"))
+        else:
+            while True:
+                try:
+                    header = await reader.readexactly(4)
+                except asyncio.IncompleteReadError:
+                    break
+                writer.write(await reader.readexactly(int.from_bytes(header, "big")))
+        await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+async def _tcp_bulk(port, duration):
+    """Stream to the sink for duration seconds; return (bytes acknowledged, seconds)"""
+    import asyncio
+    reader, writer = await asyncio.open_connection(LOOPBACK_HOST, port)
+    payload = bytes(TCP_BULK_CHUNK)
+    writer.write(b"S")
+    start = time.perf_counter()
+    deadline = start + duration
+    while time.perf_counter() < deadline:
+        writer.write(payload)
+        await writer.drain()
+    writer.write_eof()
+    received = int.from_bytes(await reader.readexactly(8), "big")
+    elapsed = time.perf_counter() - start
+    writer.close()
+    await writer.wait_closed()
+    return received, elapsed
+
+async def _tcp_round_trips(port, size, count):
+    """Time count echo round trips of size-byte messages; return sorted ns samples"""
+    import asyncio
+    reader, writer = await asyncio.open_connection(LOOPBACK_HOST, port)
+    message = size.to_bytes(4, "big") + bytes(size)
+    writer.write(b"E")
+    samples = []
+    for i in range(count + RTT_WARMUP):
+        start = time.perf_counter_ns()
+        writer.write(message)
+        await reader.readexactly(size)
+        if i >= RTT_WARMUP:
+            samples.append(time.perf_counter_ns() - start)
+    writer.close()
+    await writer.wait_closed()
+    return samples
+
+class _UDPSink:
+    """Datagram protocol that only counts what arrives"""
+
+    def __init__(self):
+        self.packets = 0
+
+    def connection_made(self, transport):
+        pass
+
+    def datagram_received(self, data, addr):
+        self.packets += 1
+
+    def error_received(self, exc):
+        pass
+
+    def connection_lost(self, exc):
+        pass
+
+async def _udp_flood(port, sink, size, duration, window=32):
+    """Send size-byte datagrams for duration seconds, keeping at most window in flight.
+
+    Unpaced senders just overflow the receive buffer, so this measures the
+    packet rate the stack sustains end to end. Returns (sent, received, seconds).
+    """
+    import asyncio
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(
+        asyncio.DatagramProtocol, remote_addr=(LOOPBACK_HOST, port))
+    payload = bytes(size)
+    before = sink.packets
+    sent = 0
+    lost = 0  # Written off after a stall, so they don't hold up later windows
+    start = time.perf_counter()
+    deadline = start + duration
+    while time.perf_counter() < deadline:
+        for _ in range(window):
+            transport.sendto(payload)
+        sent += window
+        # Wait for the window to drain; a stall means the rest were dropped
+        stalled = time.perf_counter() + 0.1
+        while sink.packets - before + lost < sent:
+            if time.perf_counter() >= stalled:
+                lost = sent - (sink.packets - before)
+                break
+            await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+    transport.close()
+    return sent, sink.packets - before, elapsed
+
+async def _network_benchmark_async(duration, message_sizes, round_trips, connection_counts, udp_sizes):
+    import asyncio
+    loop = asyncio.get_running_loop()
+    server = await asyncio.start_server(_tcp_server_handler, LOOPBACK_HOST, 0)
+    port = server.sockets[0].getsockname()[1]
+    sink = _UDPSink()
+    udp_transport, _ = await loop.create_datagram_endpoint(lambda: sink, local_addr=(LOOPBACK_HOST, 0))
+    udp_port = udp_transport.get_extra_info("sockname")[1]
+    results = {}
+    try:
+        check_cancelled()
+        received, elapsed = await _tcp_bulk(port, duration)
+        results["TCP Throughput (MB/s)"] = round(received / elapsed / 1e6, 1)
+
+        rtt = {}
+        for size in message_sizes:
+            check_cancelled()
+            samples = sorted(await _tcp_round_trips(port, size, round_trips))
+            rtt[format_size(size)] = {k: round(v / 1e3, 1) for k, v in _percentiles(samples).items()}
+        results["TCP RTT (us)"] = rtt
+
+        scaling = []
+        for count in connection_counts:
+            check_cancelled()
+            bulk = await asyncio.gather(*[_tcp_bulk(port, duration / 2) for _ in range(count)])
+            batches = await asyncio.gather(
+                *[_tcp_round_trips(port, 64, max(100, round_trips // count)) for _ in range(count)])
+            samples = sorted(sample for batch in batches for sample in batch)
+            scaling.append({
+                "Connections": count,
+                "Aggregate MB/s": round(sum(r[0] for r in bulk) / max(r[1] for r in bulk) / 1e6, 1),
+                "RTT p50 (us)": round(samples[len(samples) // 2] / 1e3, 1),
+                "RTT p99 (us)": round(_percentiles(samples)["p99"] / 1e3, 1),
+            })
+        results["TCP Connection Scaling"] = scaling
+
+        udp = {}
+        for size in udp_sizes:
+            check_cancelled()
+            sent, received, elapsed = await _udp_flood(udp_port, sink, size, duration / 2)
+            udp[f"{size} B"] = {
+                "Sent Packets/s": round(sent / elapsed),
+                "Received Packets/s": round(received / elapsed),
+                "Loss (%)": round(100 * (sent - received) / sent, 2) if sent else 0.0,
+            }
+        results["UDP"] = udp
+    finally:
+        udp_transport.close()
+        server.close()
+        await server.wait_closed()
+    return results
+
+def network_benchmark(duration=2.0, message_sizes=(64, 1024, 16384, 65536), round_trips=2000,
+                      connection_counts=(1, 4, 16), udp_sizes=(64, 1400)):
+    """Loopback TCP/UDP benchmark against an asyncio server in the same process.
+
+    Measures TCP bulk throughput, echo round-trip percentiles per message size,
+    how throughput and latency change with concurrent connections, and UDP
+    packets/s. Client and server share one event loop and never leave the
+    host, so figures are kernel network stack plus asyncio overhead, with no
+    NIC or outside service involved.
+    """
+    import asyncio
+    try:
+        results = asyncio.run(_network_benchmark_async(
+            duration, message_sizes, round_trips, connection_counts, udp_sizes))
+        return {"Loopback Network Benchmark": results}
+    except Exception as e:
+        return {"Error": f"Failed loopback network benchmark: {str(e)}"}
+
+# --------------------------
+# Benchmark Registry
+# --------------------------
+
+DEFAULT_BENCHMARK_TIMEOUT = 300  # seconds
+
+class BenchmarkSpec:
+    """Declaration of one benchmark: what to call, how to run it and what it needs.
+
+    warmup and repetitions are passed to func when set. resources may hold
+    "memory_mb" and "disk_mb" minimums that are checked before the run.
+    isolated benchmarks run in a fresh interpreter, so heap and GC state left
+    by earlier benchmarks (or the GUI) doesn't leak into their figures.
+    """
+
+    def __init__(self, name, func, suite, warmup=None, repetitions=None,
+                 timeout=DEFAULT_BENCHMARK_TIMEOUT, resources=None, isolated=True, params=None):
+        import inspect
+        accepted = inspect.signature(func).parameters
+        for option, value in (("warmup", warmup), ("repetitions", repetitions)):
+            if value is not None and option not in accepted:
+                raise ValueError(f"{func.__name__}() does not take {option}")
+        self.name = name
+        self.func = func
+        self.accepts = set(accepted)
+        self.suite = suite
+        self.warmup = warmup
+        self.repetitions = repetitions
+        self.timeout = timeout
+        self.resources = resources or {}
+        self.isolated = isolated
+        self.params = params or {}
+
+    def kwargs(self, overrides=None):
+        """Keyword arguments for func: declared params, then warmup/repetitions, then overrides"""
+        kwargs = dict(self.params)
+        if self.warmup is not None:
+            kwargs["warmup"] = self.warmup
+        if self.repetitions is not None:
+            kwargs["repetitions"] = self.repetitions
+        kwargs.update(overrides or {})
+        return kwargs
+
+BENCHMARKS = {}
+
+def register_benchmark(name, func, suite, **options):
+    """Add a benchmark to the registry; options are BenchmarkSpec keywords"""
+    BENCHMARKS[name] = BenchmarkSpec(name, func, suite, **options)
+    return BENCHMARKS[name]
+
+register_benchmark("cpu", cpu_benchmark, "Benchmarks", warmup=1, repetitions=5, timeout=60)
+register_benchmark("memory", memory_benchmark, "Benchmarks", repetitions=5, timeout=120,
+                   resources={"memory_mb": 1024})
+register_benchmark("disk", disk_benchmark, "Benchmarks", timeout=120, resources={"disk_mb": 256})
+register_benchmark("extended_cpu", extended_cpu_benchmark, "Extended Benchmarks",
+                   warmup=1, repetitions=5, timeout=120)
+# Its workers are already separate processes; it only needs the parent to coordinate
+register_benchmark("multicore_cpu", multicore_cpu_benchmark, "Extended Benchmarks",
+                   repetitions=3, timeout=600, isolated=False)
+register_benchmark("compression", compression_benchmark, "Extended Benchmarks",
+                   warmup=1, repetitions=3, timeout=600, resources={"memory_mb": 256})
+register_benchmark("numpy_compute", numpy_compute_benchmark, "Extended Benchmarks",
+                   warmup=1, repetitions=5, timeout=300, resources={"memory_mb": 512})
+register_benchmark("memory_latency", memory_latency_benchmark, "Extended Benchmarks",
+                   repetitions=7, timeout=900, resources={"memory_mb": 512})
+register_benchmark("extended_disk", extended_disk_benchmark, "Extended Benchmarks",
+                   timeout=900, resources={"disk_mb": 1024})
+register_benchmark("read_path", read_path_benchmark, "Extended Benchmarks",
+                   repetitions=3, timeout=600, resources={"disk_mb": 1024})
+register_benchmark("metadata", metadata_benchmark, "Extended Benchmarks",
+                   timeout=300, resources={"disk_mb": 128})
+register_benchmark("network", network_benchmark, "Extended Benchmarks", timeout=300)
+
+def select_benchmarks(suite=None, names=None):
+    """Return registered specs by suite and/or name, in registration order"""
+    return [
+        spec for spec in BENCHMARKS.values()
+        if (suite is None or spec.suite == suite) and (names is None or spec.name in names)
+    ]
+
+def _missing_resources(spec, kwargs):
+    """Return why spec can't run with kwargs on this machine right now, or None"""
+    needs = spec.resources
+    if "memory_mb" in needs:
+        available = psutil.virtual_memory().available // 1024 ** 2
+        if available < needs["memory_mb"]:
+            return f"needs {needs['memory_mb']} MB free memory, {available} MB available"
+    if "disk_mb" in needs:
+        try:
+            directory = benchmark_dir(kwargs.get("mountpoint"))
+            free = psutil.disk_usage(directory).free // 1024 ** 2
+        except (OSError, ValueError) as e:
+            return str(e)
+        if free < needs["disk_mb"]:
+            return f"needs {needs['disk_mb']} MB free in {directory}, {free} MB free"
+    return None
+
+BENCHMARK_POLL_INTERVAL = 0.1  # seconds between cancellation checks while waiting
+BENCHMARK_STOP_GRACE = 10.0  # seconds an isolated benchmark gets to clean up before it is killed
+
+def _run_inline(spec, kwargs, token):
+    """Run spec in a daemon thread of this process, giving up after its timeout.
+
+    Returns (results, timer calibration used or None). On cancellation the
+    thread is abandoned; it stops at its next check_cancelled() call.
+    """
+    outcome = {}
+    uses = _timer_calibration_uses
+
+    def run():
+        _benchmark_context.token = token
+        try:
+            with wmi_provider.thread_scope():
+                outcome["result"] = spec.func(**kwargs)
+        except Exception as e:
+            outcome["result"] = {"Error": f"Benchmark {spec.name} failed: {str(e)}"}
+
+    worker = threading.Thread(target=run, daemon=True)
+    worker.start()
+    deadline = time.monotonic() + spec.timeout
+    while worker.is_alive():
+        if token.cancelled:
+            return {"Error": f"Benchmark {spec.name} cancelled"}, None
+        if time.monotonic() >= deadline:
+            return {"Error": f"Benchmark {spec.name} timed out after {spec.timeout}s"}, None
+        worker.join(BENCHMARK_POLL_INTERVAL)
+    return outcome["result"], applied_timer_report(since=uses)
+
+def _stop_child(proc):
+    """Ask an isolated benchmark to stop so its cleanup runs; kill it if it doesn't"""
+    import signal
+    import subprocess
+    try:
+        if os.name == "nt":
+            proc.send_signal(signal.CTRL_BREAK_EVENT)
+        else:
+            proc.send_signal(signal.SIGTERM)
+        proc.communicate(timeout=BENCHMARK_STOP_GRACE)
+    except (subprocess.TimeoutExpired, OSError):
+        proc.kill()
+        proc.communicate()
+
+def _run_isolated(spec, kwargs, token):
+    """Run spec in a fresh interpreter and read its JSON result from stdout.
+
+    Returns (results, the child's own timer calibration or None). On timeout
+    or cancellation the child is signalled first (see benchmark_main), so
+    temp files are removed, and killed only if it is still running after
+    BENCHMARK_STOP_GRACE.
+    """
+    import subprocess
+    command = [sys.executable, os.path.abspath(__file__), "--run-benchmark", spec.name, json.dumps(kwargs)]
+    # Windows delivers CTRL_BREAK to a whole process group; give the child its own
+    flags = subprocess.CREATE_NEW_PROCESS_GROUP if os.name == "nt" else 0
+    try:
+        proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                                creationflags=flags)
+    except OSError as e:
+        return {"Error": f"Failed to start benchmark {spec.name}: {str(e)}"}, None
+    deadline = time.monotonic() + spec.timeout
+    while True:
+        try:
+            stdout, stderr = proc.communicate(timeout=BENCHMARK_POLL_INTERVAL)
+            break
+        except subprocess.TimeoutExpired:
+            if token.cancelled or time.monotonic() >= deadline:
+                _stop_child(proc)
+                if token.cancelled:
+                    return {"Error": f"Benchmark {spec.name} cancelled"}, None
+                return {"Error": f"Benchmark {spec.name} timed out after {spec.timeout}s"}, None
+    lines = stdout.strip().splitlines()
+    if proc.returncode != 0 or not lines:
+        detail = (stderr.strip().splitlines() or ["no output"])[-1]
+        return {"Error": f"Benchmark {spec.name} exited with {proc.returncode}: {detail}"}, None
+    try:
+        output = json.loads(lines[-1])
+        return output["results"], output["timer_calibration"]
+    except (ValueError, KeyError, TypeError) as e:
+        return {"Error": f"Benchmark {spec.name} printed unreadable output: {str(e)}"}, None
+
+def run_benchmark(name, isolated=None, token=None, **overrides):
+    """Run one registered benchmark; return (results, run info)"""
+    spec = BENCHMARKS[name]
+    token = token or CancellationToken()
+    isolated = spec.isolated if isolated is None else isolated
+    info = {"Mode": "subprocess" if isolated else "in-process"}
+    kwargs = spec.kwargs(overrides)
+    missing = _missing_resources(spec, kwargs)
+    if missing:
+        info["Status"] = f"Skipped ({missing})"
+        return {}, info
+    start = time.perf_counter()
+    results, calibration = (_run_isolated if isolated else _run_inline)(spec, kwargs, token)
+    info["Wall Time (s)"] = round(time.perf_counter() - start, 2)
+    if calibration is not None:
+        # The process that ran the benchmark calibrated and corrected with these
+        info["Timer Calibration"] = calibration
+    if token.cancelled:
+        info["Status"] = "Cancelled"
+    else:
+        info["Status"] = results["Error"] if _has_error(results) else "OK"
+    return results, info
+
+def run_benchmark_suite(suite=None, names=None, isolated=None, token=None, progress=None,
+                        mountpoint=None):
+    """Run the selected benchmarks in order and merge their results.
+
+    mountpoint (one of benchmark_targets()) is passed to every benchmark that
+    takes one; the others run as declared.
+
+    progress, if given, is called from this thread with {"phase", "percent",
+    "partial"} events before each benchmark and after the last one. Once
+    token is cancelled the running benchmark is stopped and the rest are
+    marked "Cancelled".
+    """
+    token = token or CancellationToken()
+    specs = select_benchmarks(suite, names)
+    results = {}
+    runs = {}
+
+    def report(phase, done):
+        if progress is not None:
+            partial = dict(results, **{"Benchmark Runs": dict(runs)})
+            progress({"phase": phase, "percent": round(100 * done / max(len(specs), 1)), "partial": partial})
+
+    for i, spec in enumerate(specs):
+        if token.cancelled:
+            runs[spec.name] = {"Status": "Cancelled"}
+            continue
+        report(f"Running {spec.name} ({i + 1}/{len(specs)})", i)
+        overrides = {"mountpoint": mountpoint} if mountpoint and "mountpoint" in spec.accepts else {}
+        result, runs[spec.name] = run_benchmark(spec.name, isolated, token, **overrides)
+        if not token.cancelled:
+            results.update(result)
+    results["Benchmark Runs"] = runs
+    report("Cancelled" if token.cancelled else "Done", len(specs))
+    return results
+
+def benchmark_main(argv):
+    """Entry point for isolated runs: --run-benchmark NAME [JSON kwargs].
+
+    Prints {"results": ..., "timer_calibration": ...} as one JSON line.
+    SIGTERM (CTRL_BREAK on Windows) cancels the run by raising
+    BenchmarkCancelled in the benchmark, so its finally blocks remove any
+    test files before the process exits.
+    """
+    import signal
+    spec = BENCHMARKS[argv[0]]
+    kwargs = json.loads(argv[1]) if len(argv) > 1 else spec.kwargs()
+    token = _benchmark_context.token = CancellationToken()
+
+    def stop(signum, frame):
+        if not token.cancelled:  # Raise once; let cleanup finish after that
+            token.cancel()
+            raise BenchmarkCancelled("Benchmark cancelled")
+
+    signal.signal(signal.SIGBREAK if os.name == "nt" else signal.SIGTERM, stop)
+    try:
+        result = spec.func(**kwargs)
+    except BenchmarkCancelled as e:
+        result = {"Error": str(e)}
+    print(json.dumps({"results": result, "timer_calibration": applied_timer_report()}))
+    return 0
 
 # --------------------------
 # GUI Extended Features
@@ -599,6 +4105,8 @@ class ExtendedHardwareHouseApp(HardwareHouseApp):
             "Power Plan",
             "Locale & Timezone",
             "System Uptime",
+            "Network Throughput",
+            "Full Report",
             "Extended Benchmarks",
         ])
         self.combo.configure(values=self.category_options)
@@ -607,6 +4115,8 @@ class ExtendedHardwareHouseApp(HardwareHouseApp):
         cat = self.combo.get()
         self.textbox.delete("0.0", "end")
         info = {}
+        # Any stream still feeding the textbox belongs to the previous category
+        self._stream_token = object()
 
         # Check new categories first
         if cat == "USB Devices":
@@ -616,24 +4126,25 @@ class ExtendedHardwareHouseApp(HardwareHouseApp):
         elif cat == "Printers":
             info = {"Printers": get_printers()}
         elif cat == "Installed Software":
-            info = {"Installed Software": get_installed_software()}
+            self.stream_installed_software()
+            return
         elif cat == "Power Plan":
             info = get_power_plan()
         elif cat == "Locale & Timezone":
             info = get_system_locale()
         elif cat == "System Uptime":
             info = get_system_uptime()
+        elif cat == "Network Throughput":
+            self.watch(lambda: {"Network Throughput": get_network_throughput()})
+            return
+        elif cat == "Process Table":
+            self.watch(lambda: get_process_table())
+            return
+        elif cat == "Full Report":
+            self.show_full_report()
+            return
         elif cat == "Extended Benchmarks":
-            self.textbox.insert("end", "Running extended benchmarks...\n")
-            def run_extended_benchmarks():
-                results = {}
-                results.update(extended_cpu_benchmark())
-                results.update(extended_memory_benchmark())
-                results.update(extended_disk_benchmark())
-                self.current_info = results
-                self.textbox.after(0, lambda: self.display_info(results))
-
-            threading.Thread(target=run_extended_benchmarks).start()
+            self.start_benchmarks("Extended Benchmarks")
             return
         else:
             # Fallback to parent categories
@@ -643,10 +4154,119 @@ class ExtendedHardwareHouseApp(HardwareHouseApp):
         self.current_info = info
         self.display_info(info)
 
+    def watch(self, collect, interval_ms=1000, poll_ms=50):
+        """Redraw collect()'s result every interval while the category stays selected.
+
+        collect() runs on a worker thread so a slow refresh (a process table on
+        a host with thousands of processes) doesn't freeze the UI; its result
+        comes back through a queue drained on the Tk main thread, and the next
+        refresh starts only after the previous one has been drawn.
+        """
+        token = self._stream_token
+        results = queue.Queue()
+        self.textbox.insert("end", "Collecting...\n")
+
+        def run():
+            with wmi_provider.thread_scope():
+                info = collect()
+            results.put(info)
+
+        def poll():
+            if token is not self._stream_token:
+                return
+            try:
+                info = results.get_nowait()
+            except queue.Empty:
+                self.after(poll_ms, poll)
+                return
+            self.set_info(info)
+            self.after(interval_ms, start)
+
+        def start():
+            if token is not self._stream_token:
+                return
+            threading.Thread(target=run, daemon=True).start()
+            self.after(poll_ms, poll)
+
+        start()
+
+    def show_full_report(self, poll_ms=100):
+        """Collect the full report on a worker thread and show it if the category is still selected"""
+        token = self._stream_token
+        results = queue.Queue()
+        self.textbox.insert("end", "Collecting full report...\n")
+
+        def run():
+            start = time.perf_counter()
+            with wmi_provider.thread_scope():
+                report = collect_full_report(cache=snapshot_cache)
+            report["Report Info"] = {
+                "Collected At": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "Collection Time (s)": round(time.perf_counter() - start, 2),
+            }
+            results.put(report)
+
+        def poll():
+            if token is not self._stream_token:
+                return  # The user moved on to another category
+            try:
+                report = results.get_nowait()
+            except queue.Empty:
+                self.after(poll_ms, poll)
+                return
+            self.set_info(report)
+
+        threading.Thread(target=run, daemon=True).start()
+        self.after(poll_ms, poll)
+
+    def stream_installed_software(self, batch_size=50, poll_ms=100):
+        """Show installed software as it is read instead of after the full scan.
+
+        The worker thread only fills a queue with batches; poll() draws them
+        on the Tk main thread until the scan is done or the user moves on.
+        """
+        token = self._stream_token
+        self.textbox.insert("end", "Installed Software:\n")
+        batches = queue.Queue()
+        software = []
+
+        def run():
+            batch = []
+            try:
+                for record in iter_installed_software():
+                    batch.append(record)
+                    if len(batch) >= batch_size:
+                        batches.put((batch, False))
+                        batch = []
+            except Exception as e:
+                batch.append({"Error": f"Failed to get software list: {str(e)}"})
+            batches.put((batch, True))
+
+        def poll():
+            if token is not self._stream_token:
+                return  # The user moved on to another category
+            try:
+                while True:
+                    batch, done = batches.get_nowait()
+                    start = len(software) + 1
+                    software.extend(batch)
+                    self.insert_info(batch, indent=1, start=start)
+                    if done:
+                        self.current_info = {"Installed Software": software}
+                        return
+            except queue.Empty:
+                pass
+            self.after(poll_ms, poll)
+
+        threading.Thread(target=run, daemon=True).start()
+        self.after(poll_ms, poll)
+
 # --------------------------
 # Main Entry Point
 # --------------------------
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--run-benchmark":
+        sys.exit(benchmark_main(sys.argv[2:]))
     app = ExtendedHardwareHouseApp()
     app.mainloop()